@@ -3,8 +3,35 @@ Animation Manager for Quantum Roulette
 """
 
 import tkinter as tk
-from typing import Callable, Dict
+import tkinter.font as tkFont
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 import math
+import time
+
+# Number of frames in the shot animation; the gun turns 30° over them
+SHOT_FRAMES = 10
+
+
+@lru_cache(maxsize=256)
+def blend_colors(color1: str, color2: str, ratio: float) -> str:
+    # Red and blue share one word and green another, so each blend is two
+    # multiplies per color; channels can't carry into each other since
+    # 255 * 256 still fits in 16 bits.
+    v1, v2 = int(color1[1:7], 16), int(color2[1:7], 16)
+    k = int(ratio * 256)
+    rb = ((v1 & 0xff00ff) * (256 - k) + (v2 & 0xff00ff) * k) >> 8 & 0xff00ff
+    g = ((v1 & 0x00ff00) * (256 - k) + (v2 & 0x00ff00) * k) >> 8 & 0x00ff00
+    return f'#{rb | g:06x}'
+
+
+@lru_cache(maxsize=256)
+def darken_color(color: str, factor: float = 0.7) -> str:
+    v = int(color[1:7], 16)
+    k = int(factor * 256)
+    rb = (v & 0xff00ff) * k >> 8 & 0xff00ff
+    g = (v & 0x00ff00) * k >> 8 & 0x00ff00
+    return f'#{rb | g:06x}'
 
 
 class AnimationManager:
@@ -14,15 +41,130 @@ class AnimationManager:
         self.root = root
         self.colors = colors
         self.animation_running = False
+        
+        # Shared fonts, so Tk doesn't re-resolve a font spec per text item
+        self._font_label = tkFont.Font(root=root, family='Arial', size=12, weight='bold')
+        self._font_turn = tkFont.Font(root=root, family='Arial', size=10, weight='bold')
+        self._font_caption = tkFont.Font(root=root, family='Arial', size=14, weight='bold')
+        self._font_bang = tkFont.Font(root=root, family='Arial', size=48, weight='bold')
+        
+        # Derived palettes depend only on the colors, so build them once
+        self._dark = {k: darken_color(v) for k, v in colors.items()}
+        self._halo = {
+            k: self._render_halo([blend_colors(colors[k], colors['bg_dark'], 0.3 * i) for i in (1, 2, 3)])
+            for k in ('player1', 'player2')
+        }
+        
+        self._flash_imgs = self._render_flash_frames()
+        
+        # Gun barrel offsets per shot frame (length 60, rotation frame/10 * 30°)
+        self._gun_dx = [60 * math.cos(math.radians(i / SHOT_FRAMES * 30)) for i in range(SHOT_FRAMES + 1)]
+        self._gun_dy = [60 * math.sin(math.radians(i / SHOT_FRAMES * 30)) for i in range(SHOT_FRAMES + 1)]
+        
+        # Canvas item IDs of each scene, reused across redraws. Every item is
+        # tagged with its scene; switching scenes hides one tag and shows the
+        # other instead of deleting the items
+        self._canvas: Optional[tk.Canvas] = None
+        self._scene: Optional[str] = None
+        self._scene_items: Dict[str, Dict[str, int]] = {}
+        self._items: Dict[str, int] = {}
+        # Canvas size the static table was drawn at; reset only for a new canvas
+        self._last_scene: Optional[Tuple[int, int]] = None
+        # Player highlighted on the table scene, and where each player stands
+        self._table_player: Optional[int] = None
+        self._table_anchors: Dict[int, Tuple[int, int]] = {}
+        # Updates to existing items, sent to Tcl as one script per draw
+        self._tcl_batch: List[str] = []
+        
+        # Striped table pattern, rendered once per table size
+        self._pattern_img: Optional[tk.PhotoImage] = None
+        self._pattern_img_size: Optional[Tuple[int, int]] = None
+        
+        # Canvas size, kept current by a <Configure> binding
+        self._size_canvas: Optional[tk.Canvas] = None
+        self._size: Tuple[int, int] = (0, 0)
+        
+        # Draw requests are coalesced and run once Tk is idle
+        self._redraw_pending = False
+        self._pending_draw: Optional[Callable] = None
+    
+    def schedule_draw(self, draw: Callable):
+        """Run draw when Tk is idle; only the latest pending request is kept"""
+        self._pending_draw = draw
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._actual_draw)
+    
+    def _actual_draw(self):
+        self._redraw_pending = False
+        draw, self._pending_draw = self._pending_draw, None
+        if draw:
+            draw()
+    
+    def _canvas_size(self, canvas: tk.Canvas) -> Tuple[int, int]:
+        """Return the cached canvas size, binding <Configure> on first use"""
+        if canvas is not self._size_canvas:
+            self._size_canvas = canvas
+            self._size = (canvas.winfo_width(), canvas.winfo_height())
+            canvas.bind('<Configure>', self._on_canvas_configure, add='+')
+        return self._size
     
-    def draw_table_scene(self, canvas: tk.Canvas, current_player: int):
-        """Draw the game table with two players"""
-        canvas.delete("all")
+    def _on_canvas_configure(self, event):
+        if event.widget is self._size_canvas:
+            self._size = (event.width, event.height)
+    
+    def _begin_scene(self, canvas: tk.Canvas, scene: str):
+        """Make scene the visible one, keeping the items of the other scenes hidden"""
+        if canvas is not self._canvas:
+            self._canvas = canvas
+            self._scene = None
+            self._scene_items = {}
+            self._last_scene = None
+            self._tcl_batch = []
+        
+        if scene != self._scene:
+            # Queued updates belong to the scene being hidden
+            self._flush(canvas)
+            if self._scene is not None:
+                canvas.itemconfigure(self._scene, state='hidden')
+            canvas.itemconfigure(scene, state='normal')
+            self._scene = scene
+            self._items = self._scene_items.setdefault(scene, {})
+            # Showing the scene's tag showed every glow, so reapply the highlight
+            self._table_player = None
+    
+    def _place(self, canvas: tk.Canvas, key: str, kind: str, *coords, **options) -> int:
+        """Move the item stored under key, creating it on first use"""
+        item = self._items.get(key)
+        if item is None:
+            tags = options.get('tags', ())
+            options['tags'] = (self._scene, tags) if isinstance(tags, str) else (self._scene, *tags)
+            item = getattr(canvas, f'create_{kind}')(*coords, **options)
+            self._items[key] = item
+        else:
+            self._queue(canvas, 'coords', item, *coords)
+        return item
+    
+    def _queue(self, canvas: tk.Canvas, *words):
+        """Queue a canvas widget command for the next _flush"""
+        self._tcl_batch.append(' '.join(map(str, (canvas, *words))))
+    
+    def _flush(self, canvas: tk.Canvas):
+        """Run all queued canvas commands in a single Tcl evaluation"""
+        if self._tcl_batch:
+            canvas.tk.eval('\n'.join(self._tcl_batch))
+            self._tcl_batch = []
+    
+    def draw_table_scene(self, canvas: tk.Canvas, current_player: int,
+                         size: Optional[Tuple[int, int]] = None):
+        """Draw the game table with two players
+        
+        size is the canvas size when the caller already knows it, which saves
+        waiting for the canvas to be laid out; otherwise the canvas is queried.
+        """
+        self._begin_scene(canvas, 'table')
         
-        # Get actual canvas size
-        canvas.update_idletasks()
-        width = canvas.winfo_width()
-        height = canvas.winfo_height()
+        width, height = size if size else self._canvas_size(canvas)
         
         # Fallback if canvas not yet sized
         if width < 100:
@@ -30,7 +172,17 @@ class AnimationManager:
         if height < 100:
             height = 350
         
-        canvas.create_rectangle(0, 0, width, height, fill=self.colors['bg_dark'], outline='')
+        # The table only needs drawing when the canvas is new or resized; a turn
+        # change just moves the highlight
+        if (width, height) != self._last_scene:
+            self._last_scene = (width, height)
+            self._draw_table_static(canvas, width, height)
+        self.update_current_player_highlight(canvas, current_player)
+    
+    def _draw_table_static(self, canvas: tk.Canvas, width: int, height: int):
+        """Draw the table, gun and both players, with nobody highlighted"""
+        self._place(canvas, 'bg', 'rectangle', 0, 0, width, height,
+            fill=self.colors['bg_dark'], outline='', tags='static_bg')
         
         # Table - centered and proportional
         table_width = int(width * 0.45)
@@ -39,23 +191,21 @@ class AnimationManager:
         table_y = (height - table_height) // 2
         
         # Table shadow
-        canvas.create_rectangle(
+        self._place(canvas, 'table_shadow', 'rectangle',
             table_x + 5, table_y + 5,
             table_x + table_width + 5, table_y + table_height + 5,
-            fill='#0a0a15', outline='')
+            fill='#0a0a15', outline='', tags='static_bg')
         
         # Table surface
-        canvas.create_rectangle(
+        self._place(canvas, 'table', 'rectangle',
             table_x, table_y,
             table_x + table_width, table_y + table_height,
-            fill='#2d1f1f', outline='#4a3030', width=3)
+            fill='#2d1f1f', outline='#4a3030', width=3, tags='static_bg')
         
         # Table pattern
-        for i in range(0, table_width, 20):
-            canvas.create_line(
-                table_x + i, table_y,
-                table_x + i, table_y + table_height,
-                fill='#3d2f2f', width=1)
+        pattern = self._place(canvas, 'table_pattern', 'image', table_x, table_y,
+            anchor='nw', tags='static_bg')
+        canvas.itemconfigure(pattern, image=self._table_pattern(table_width, table_height))
         
         # Gun in center
         gun_x = width // 2
@@ -65,75 +215,130 @@ class AnimationManager:
         # Player 1 (left side) - with proper spacing
         p1_x = table_x - 70
         p1_y = height // 2
-        p1_active = current_player == 1
-        self.draw_player(canvas, p1_x, p1_y, 1, p1_active, facing_right=True)
+        self.draw_player(canvas, p1_x, p1_y, 1, False, facing_right=True)
         
         # Player 2 (right side)
         p2_x = table_x + table_width + 70
         p2_y = height // 2
-        p2_active = current_player == 2
-        self.draw_player(canvas, p2_x, p2_y, 2, p2_active, facing_right=False)
+        self.draw_player(canvas, p2_x, p2_y, 2, False, facing_right=False)
         
-        # Turn indicator
-        if current_player == 1:
-            self.draw_turn_indicator(canvas, p1_x, p1_y - 70, self.colors['player1'])
-        else:
-            self.draw_turn_indicator(canvas, p2_x, p2_y - 70, self.colors['player2'])
+        self._table_anchors = {1: (p1_x, p1_y), 2: (p2_x, p2_y)}
+        self._table_player = None
+    
+    def update_current_player_highlight(self, canvas: tk.Canvas, current_player: int):
+        """Light up the current player's glow and move the turn indicator to them"""
+        if current_player != self._table_player:
+            self._table_player = current_player
+            for player_num in (1, 2):
+                state = 'normal' if player_num == current_player else 'hidden'
+                self._queue(canvas, 'itemconfigure', self._items[f'p{player_num}_glow'], '-state', state)
+            
+            x, y = self._table_anchors[current_player]
+            self.draw_turn_indicator(canvas, x, y - 70, f'player{current_player}')
+        
+        self._flush(canvas)
+    
+    def _table_pattern(self, width: int, height: int) -> tk.PhotoImage:
+        """Return the table's vertical stripe pattern as a transparent image"""
+        if self._pattern_img_size != (width, height):
+            img = tk.PhotoImage(master=self.root, width=width, height=height)
+            for i in range(0, width, 20):
+                img.put('#3d2f2f', to=(i, 0, i + 1, height))
+            self._pattern_img = img
+            self._pattern_img_size = (width, height)
+        return self._pattern_img
+    
+    def _render_ellipses(self, width: int, height: int,
+                         rings: List[Tuple[float, float, str]]) -> tk.PhotoImage:
+        """Paint centered (x radius, y radius, color) ellipses, in order, into a transparent image"""
+        img = tk.PhotoImage(master=self.root, width=width, height=height)
+        for a, b, color in rings:
+            for row in range(height):
+                dy = row + 0.5 - height / 2
+                if abs(dy) < b:
+                    half = a * math.sqrt(1 - (dy / b) ** 2)
+                    x0, x1 = round(width / 2 - half), round(width / 2 + half)
+                    if x1 > x0:
+                        img.put(color, to=(x0, row, x1, row + 1))
+        return img
+    
+    def _render_halo(self, shades: List[str]) -> tk.PhotoImage:
+        """Render the active-player glow (three nested ellipses) into one image"""
+        # Outermost ring first so the inner rings paint over it
+        return self._render_ellipses(80, 100,
+            [(25 + i * 5, 35 + i * 5, shades[i - 1]) for i in range(3, 0, -1)])
+    
+    def _render_flash_frames(self) -> List[tk.PhotoImage]:
+        """Render each muzzle flash frame: fewer, larger fireball rings as it fades"""
+        colors = ['#ffff00', '#ff8800', '#ff4400', '#ff0000', '#880000']
+        frames = []
+        for frame in range(len(colors)):
+            size = 30 + frame * 10
+            rings = [(size - i * 5, size - i * 5, color)
+                     for i, color in enumerate(colors[:len(colors) - frame])]
+            frames.append(self._render_ellipses(2 * size, 2 * size, rings))
+        return frames
     
     def draw_player(self, canvas: tk.Canvas, x: int, y: int, player_num: int, 
                     active: bool, facing_right: bool):
-        color = self.colors['player1'] if player_num == 1 else self.colors['player2']
+        player_key = 'player1' if player_num == 1 else 'player2'
+        color = self.colors[player_key]
+        dark = self._dark[player_key]
+        tag = f'p{player_num}'
         
-        if active:
-            for i in range(3, 0, -1):
-                alpha_color = self.blend_colors(color, self.colors['bg_dark'], 0.3 * i)
-                canvas.create_oval(
-                    x - 25 - i*5, y - 35 - i*5,
-                    x + 25 + i*5, y + 35 + i*5,
-                    fill=alpha_color, outline='')
+        glow = self._place(canvas, f'{tag}_glow', 'image', x, y,
+            image=self._halo[player_key], tags=(tag, f'{tag}_glow'))
+        self._queue(canvas, 'itemconfigure', glow, '-state', 'normal' if active else 'hidden')
         
-        canvas.create_oval(x - 20, y - 10, x + 20, y + 30,
-            fill=color, outline=self.darken_color(color), width=2)
+        self._place(canvas, f'{tag}_body', 'oval', x - 20, y - 10, x + 20, y + 30,
+            fill=color, outline=dark, width=2, tags=tag)
         
-        canvas.create_oval(x - 15, y - 35, x + 15, y - 5,
-            fill=color, outline=self.darken_color(color), width=2)
+        self._place(canvas, f'{tag}_head', 'oval', x - 15, y - 35, x + 15, y - 5,
+            fill=color, outline=dark, width=2, tags=tag)
         
         eye_offset = 5 if facing_right else -5
-        canvas.create_oval(x + eye_offset - 3, y - 25, x + eye_offset + 3, y - 19, fill='white')
-        canvas.create_oval(x + eye_offset - 1, y - 24, x + eye_offset + 1, y - 20, fill='black')
+        self._place(canvas, f'{tag}_eye', 'oval',
+            x + eye_offset - 3, y - 25, x + eye_offset + 3, y - 19, fill='white', tags=tag)
+        self._place(canvas, f'{tag}_pupil', 'oval',
+            x + eye_offset - 1, y - 24, x + eye_offset + 1, y - 20, fill='black', tags=tag)
         
         arm_dir = 1 if facing_right else -1
-        canvas.create_line(
+        self._place(canvas, f'{tag}_arm', 'line',
             x + arm_dir * 15, y,
             x + arm_dir * 40, y - 10,
-            fill=self.darken_color(color), width=6, capstyle='round')
+            fill=dark, width=6, capstyle='round', tags=tag)
         
         label = f"P{player_num}"
-        canvas.create_text(x, y + 50, text=label, fill=color, font=('Arial', 12, 'bold'))
+        self._place(canvas, f'{tag}_label', 'text', x, y + 50,
+            text=label, fill=color, font=self._font_label, tags=tag)
     
     def draw_gun(self, canvas: tk.Canvas, x: int, y: int):
-        canvas.create_rectangle(x - 60, y - 8, x + 60, y + 8,
-            fill='#3d3d3d', outline='#2a2a2a', width=2)
+        self._place(canvas, 'gun_body', 'rectangle', x - 60, y - 8, x + 60, y + 8,
+            fill='#3d3d3d', outline='#2a2a2a', width=2, tags='gun')
         
-        canvas.create_rectangle(x + 20, y - 5, x + 70, y + 5,
-            fill='#4a4a4a', outline='#333333', width=1)
+        self._place(canvas, 'gun_barrel', 'rectangle', x + 20, y - 5, x + 70, y + 5,
+            fill='#4a4a4a', outline='#333333', width=1, tags='gun')
         
-        canvas.create_polygon(
+        self._place(canvas, 'gun_grip', 'polygon',
             x - 30, y + 8, x - 20, y + 8,
             x - 15, y + 25, x - 35, y + 25,
-            fill='#5a3a2a', outline='#3a2a1a', width=2)
+            fill='#5a3a2a', outline='#3a2a1a', width=2, tags='gun')
         
-        canvas.create_arc(x - 25, y + 5, x - 5, y + 20,
-            start=180, extent=180, style='arc', outline='#333333', width=2)
+        self._place(canvas, 'gun_guard', 'arc', x - 25, y + 5, x - 5, y + 20,
+            start=180, extent=180, style='arc', outline='#333333', width=2, tags='gun')
     
-    def draw_turn_indicator(self, canvas: tk.Canvas, x: int, y: int, color: str):
-        canvas.create_polygon(
+    def draw_turn_indicator(self, canvas: tk.Canvas, x: int, y: int, player_key: str):
+        color = self.colors[player_key]
+        arrow = self._place(canvas, 'indicator_arrow', 'polygon',
             x, y + 15, x - 10, y, x - 5, y,
             x - 5, y - 15, x + 5, y - 15,
             x + 5, y, x + 10, y,
-            fill=color, outline=self.darken_color(color), width=2)
+            tags='indicator')
+        canvas.itemconfigure(arrow, fill=color, outline=self._dark[player_key], width=2)
         
-        canvas.create_text(x, y - 30, text="YOUR TURN", fill=color, font=('Arial', 10, 'bold'))
+        text = self._place(canvas, 'indicator_text', 'text', x, y - 30,
+            text="YOUR TURN", font=self._font_turn, tags='indicator')
+        canvas.itemconfigure(text, fill=color)
     
     def animate_shot(self, canvas: tk.Canvas, shooter: int, shoot_self: bool, callback: Callable):
         self.animation_running = True
@@ -150,38 +355,60 @@ class AnimationManager:
             target_x = width // 2 + 150 + 80 if shoot_self else width // 2 - 150 - 80
         target_y = height // 2
         
-        frames = 10
+        frames = SHOT_FRAMES
+        frame_period = 0.050
         current_frame = [0]
+        t_start = time.perf_counter()
         
         def animate_frame():
             if current_frame[0] < frames:
-                progress = current_frame[0] / frames
-                current_gun_x = gun_x + (target_x - gun_x) * progress * 0.3
+                frame_idx = current_frame[0]
+                current_gun_x = gun_x + (target_x - gun_x) * frame_idx / frames * 0.3
                 
-                canvas.delete("all")
-                self.draw_shooting_scene(canvas, shooter, shoot_self, current_gun_x, gun_y, progress)
+                self.schedule_draw(lambda: self.draw_shot_frame(
+                    canvas, shooter, shoot_self, current_gun_x, gun_y, frame_idx))
                 
                 current_frame[0] += 1
+                # If we've fallen a whole frame behind, drop the next frame
+                # instead of queueing up stale ones
+                expected = t_start + current_frame[0] * frame_period
+                if time.perf_counter() > expected + frame_period:
+                    current_frame[0] += 1
                 self.root.after(50, animate_frame)
             else:
                 self.show_muzzle_flash(canvas, target_x, target_y, callback)
         
         animate_frame()
     
+    def draw_shot_frame(self, canvas: tk.Canvas, shooter: int, shoot_self: bool,
+                        gun_x: float, gun_y: float, frame_idx: int):
+        if canvas is self._canvas and self._scene == 'shot':
+            # Table, players and caption are static; only the gun moves
+            self.draw_animated_gun(canvas, gun_x, gun_y, frame_idx, shooter)
+        else:
+            self.draw_shooting_scene(canvas, shooter, shoot_self, gun_x, gun_y, frame_idx)
+        self._flush(canvas)
+    
     def draw_shooting_scene(self, canvas: tk.Canvas, shooter: int, shoot_self: bool,
-                           gun_x: float, gun_y: float, progress: float):
+                           gun_x: float, gun_y: float, frame_idx: int):
+        self._begin_scene(canvas, 'shot')
+        # The muzzle flash from the previous shot stays hidden until it fires
+        self._queue(canvas, 'itemconfigure', 'flash', '-state', 'hidden')
+        
         width = canvas.winfo_width() or 600
         height = canvas.winfo_height() or 300
         
-        canvas.create_rectangle(0, 0, width, height, fill=self.colors['bg_dark'], outline='')
+        self._place(canvas, 'bg', 'rectangle', 0, 0, width, height,
+            fill=self.colors['bg_dark'], outline='', tags='static_bg')
         
         table_width = 300
         table_height = 120
         table_x = (width - table_width) // 2
         table_y = (height - table_height) // 2
         
-        canvas.create_rectangle(table_x, table_y, table_x + table_width, table_y + table_height,
-            fill='#2d1f1f', outline='#4a3030', width=3)
+        self._place(canvas, 'table', 'rectangle',
+            table_x, table_y, table_x + table_width, table_y + table_height,
+            fill='#2d1f1f', outline='#4a3030', width=3, tags='static_bg')
         
         p1_x = table_x - 80
         p2_x = table_x + table_width + 80
@@ -190,8 +417,7 @@ class AnimationManager:
         self.draw_player(canvas, p1_x, p_y, 1, shooter == 1, facing_right=True)
         self.draw_player(canvas, p2_x, p_y, 2, shooter == 2, facing_right=False)
         
-        gun_rotation = progress * 30
-        self.draw_animated_gun(canvas, gun_x, gun_y, gun_rotation, shooter)
+        self.draw_animated_gun(canvas, gun_x, gun_y, frame_idx, shooter)
         
         if shoot_self:
             action_text = f"Player {shooter} aims at themselves..."
@@ -199,67 +425,54 @@ class AnimationManager:
             target = 2 if shooter == 1 else 1
             action_text = f"Player {shooter} aims at Player {target}..."
         
-        canvas.create_text(width // 2, 30, text=action_text,
-            fill=self.colors['accent'], font=('Arial', 14, 'bold'))
+        caption = self._place(canvas, 'caption', 'text', width // 2, 30,
+            fill=self.colors['accent'], font=self._font_caption, tags='static_bg')
+        canvas.itemconfigure(caption, text=action_text)
+        self._flush(canvas)
     
     def draw_animated_gun(self, canvas: tk.Canvas, x: float, y: float, 
-                         rotation: float, holder: int):
-        rad = math.radians(rotation)
-        length = 60
-        direction = 1 if holder == 1 else -1
-        
-        x1 = x - length * math.cos(rad) * direction
-        y1 = y - length * math.sin(rad)
-        x2 = x + length * math.cos(rad) * direction
-        y2 = y + length * math.sin(rad)
-        
-        canvas.create_line(x1, y1, x2, y2, fill='#4a4a4a', width=12, capstyle='round')
-        canvas.create_oval(x2 - 5, y2 - 5, x2 + 5, y2 + 5, fill='#333333', outline='')
+                         frame_idx: int, holder: int):
+        dx = self._gun_dx[frame_idx] if holder == 1 else -self._gun_dx[frame_idx]
+        dy = self._gun_dy[frame_idx]
+        
+        x1 = x - dx
+        y1 = y - dy
+        x2 = x + dx
+        y2 = y + dy
+        
+        self._place(canvas, 'gun_line', 'line', x1, y1, x2, y2,
+            fill='#4a4a4a', width=12, capstyle='round', tags='gun')
+        self._place(canvas, 'gun_tip', 'oval', x2 - 5, y2 - 5, x2 + 5, y2 + 5,
+            fill='#333333', outline='', tags='gun')
     
     def show_muzzle_flash(self, canvas: tk.Canvas, x: int, y: int, callback: Callable):
-        width = canvas.winfo_width() or 600
-        height = canvas.winfo_height() or 300
+        width, height = self._canvas_size(canvas)
+        width = width or 600
+        height = height or 300
         
-        flash_frames = 5
+        flash_frames = len(self._flash_imgs)
         current = [0]
         
+        # Flash items are created hidden once; frames only swap the image
+        fireball = self._place(canvas, 'flash', 'image', x, y,
+            image=self._flash_imgs[0], state='hidden', tags="flash")
+        bang = self._place(canvas, 'bang', 'text', width // 2, height // 2, text="BANG!",
+            fill='#ff4400', font=self._font_bang, state='hidden', tags="flash")
+        self._flush(canvas)
+        
         def flash():
             if current[0] < flash_frames:
-                canvas.delete("flash")
-                
-                size = 30 + current[0] * 10
-                colors = ['#ffff00', '#ff8800', '#ff4400', '#ff0000', '#880000']
-                
-                for i, color in enumerate(colors[:flash_frames - current[0]]):
-                    s = size - i * 5
-                    canvas.create_oval(x - s, y - s, x + s, y + s,
-                        fill=color, outline='', tags="flash")
-                
-                if current[0] < 3:
-                    canvas.create_text(width // 2, height // 2, text="BANG!",
-                        fill='#ff4400', font=('Arial', 48, 'bold'), tags="flash")
+                self._queue(canvas, 'itemconfigure', fireball,
+                    '-image', self._flash_imgs[current[0]], '-state', 'normal')
+                self._queue(canvas, 'itemconfigure', bang,
+                    '-state', 'normal' if current[0] < 3 else 'hidden')
+                self._flush(canvas)
                 
                 current[0] += 1
                 self.root.after(80, flash)
             else:
-                canvas.delete("flash")
+                canvas.itemconfigure("flash", state='hidden')
                 self.animation_running = False
                 callback()
         
         flash()
-    
-    def blend_colors(self, color1: str, color2: str, ratio: float) -> str:
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        
-        r = int(r1 * (1 - ratio) + r2 * ratio)
-        g = int(g1 * (1 - ratio) + g2 * ratio)
-        b = int(b1 * (1 - ratio) + b2 * ratio)
-        
-        return f'#{r:02x}{g:02x}{b:02x}'
-    
-    def darken_color(self, color: str, factor: float = 0.7) -> str:
-        r = int(int(color[1:3], 16) * factor)
-        g = int(int(color[3:5], 16) * factor)
-        b = int(int(color[5:7], 16) * factor)
-        return f'#{r:02x}{g:02x}{b:02x}'
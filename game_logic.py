@@ -2,20 +2,25 @@
 Game Logic and Quantum Mechanics for Quantum Buckshot Roulette
 
 This module contains:
-- QuantumBulletSystem: Manages quantum states of bullets using Qiskit
+- QuantumBulletSystem: Manages quantum states of bullets as a statevector
 - Player: Represents a player with lives, gates, and actions
 - QuantumBuckshotGame: Main game logic controller
 
 """
 
 from enum import Enum
-from dataclasses import dataclass, field
+from functools import lru_cache
+from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Callable
-import random
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit_aer import AerSimulator
-from qiskit.quantum_info import Statevector
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy kernels below are used instead
+    njit = None
+
+# Shared generator for round setup and bullet sampling
+_rng = np.random.default_rng()
 
 
 class GateType(Enum):
@@ -36,6 +41,88 @@ class GateType(Enum):
         return self == GateType.CNOT
 
 
+# Single-qubit gate matrices; the rotations are by π/2
+_C, _S = np.cos(np.pi / 4), np.sin(np.pi / 4)
+_X = np.array([[0, 1], [1, 0]], dtype=np.complex64)
+_Y = np.array([[0, -1j], [1j, 0]], dtype=np.complex64)
+_Z = np.array([[1, 0], [0, -1]], dtype=np.complex64)
+_H = np.array([[_S, _S], [_S, -_S]], dtype=np.complex64)
+_RX = np.array([[_C, -1j * _S], [-1j * _S, _C]], dtype=np.complex64)
+_RY = np.array([[_C, -_S], [_S, _C]], dtype=np.complex64)
+_RZ = np.array([[_C - 1j * _S, 0], [0, _C + 1j * _S]], dtype=np.complex64)
+
+# Matrix for each single-qubit GateType, so apply_gate is a single lookup
+_GATE_MATRICES: Dict[GateType, np.ndarray] = {
+    GateType.X: _X,
+    GateType.Y: _Y,
+    GateType.Z: _Z,
+    GateType.H: _H,
+    GateType.RX: _RX,
+    GateType.RY: _RY,
+    GateType.RZ: _RZ,
+}
+
+
+# Gate kernels update the statevector in place. Amplitude index i has bit q
+# set when bullet q is live.
+
+def _apply_1q_numpy(state: np.ndarray, gate: np.ndarray, qubit: int):
+    # View the state as (higher bullets, this bullet, lower bullets) and
+    # update both halves in place; only the |0> half needs a copy
+    psi = state.reshape(-1, 2, 1 << qubit)
+    zero = psi[:, 0, :].copy()
+    one = psi[:, 1, :]
+    psi[:, 0, :] = gate[0, 0] * zero + gate[0, 1] * one
+    psi[:, 1, :] = gate[1, 0] * zero + gate[1, 1] * one
+
+
+@lru_cache(maxsize=None)
+def _cx_indices(size: int, control: int, target: int) -> np.ndarray:
+    # Amplitude indices with the control bit set and the target bit clear
+    index = np.arange(size)
+    return index[((index >> control) & 1 == 1) & ((index >> target) & 1 == 0)]
+
+
+def _apply_cx_numpy(state: np.ndarray, control: int, target: int):
+    # Swap the target's |0> and |1> amplitudes where the control is |1>
+    idx = _cx_indices(state.size, control, target)
+    flipped = idx ^ (1 << target)
+    state[idx], state[flipped] = state[flipped], state[idx].copy()
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _apply_1q(state, gate, qubit):
+        stride = 1 << qubit
+        for base in range(0, state.shape[0], stride << 1):
+            for k in range(base, base + stride):
+                a = state[k]
+                b = state[k + stride]
+                state[k] = gate[0, 0] * a + gate[0, 1] * b
+                state[k + stride] = gate[1, 0] * a + gate[1, 1] * b
+    
+    @njit(cache=True)
+    def _apply_cx(state, control, target):
+        control_bit = 1 << control
+        target_bit = 1 << target
+        for i in range(state.shape[0]):
+            if i & control_bit and not i & target_bit:
+                j = i | target_bit
+                state[i], state[j] = state[j], state[i]
+    
+    # Compile both kernels for the game's dtypes at import, so the first gate
+    # a player applies doesn't stall the Tk main loop (cache=True makes later
+    # sessions load them from disk)
+    _warmup_state = np.zeros(4, dtype=np.complex64)
+    _warmup_state[0] = 1
+    _apply_1q(_warmup_state, _X, 0)
+    _apply_cx(_warmup_state, 0, 1)
+    del _warmup_state
+else:
+    _apply_1q = _apply_1q_numpy
+    _apply_cx = _apply_cx_numpy
+
+
 @dataclass
 class Gate:
     """Represents a quantum gate that a player can use"""
@@ -50,16 +137,38 @@ class Gate:
         return self.gate_type.value
 
 
-@dataclass
 class Player:
     """Represents a player in the game"""
-    name: str
-    player_id: int  # 1 or 2
-    lives: int = 3
-    gates: List[Gate] = field(default_factory=list)
-    peek_available: bool = True
-    # Track gates applied by this player (for visibility)
-    applied_gates_history: List[Tuple[GateType, int, int]] = field(default_factory=list)
+    
+    def __init__(self, name: str, player_id: int, lives: int = 3,
+                 gates: Optional[List[Gate]] = None, peek_available: bool = True,
+                 applied_gates_history: Optional[List[Tuple[GateType, int, int]]] = None):
+        self.name = name
+        self.player_id = player_id  # 1 or 2
+        self.lives = lives
+        # Gates are held as parallel arrays (type, used) rather than Gate objects
+        self._gate_types = np.empty(0, dtype=object)
+        self._used = np.empty(0, dtype=bool)
+        if gates:
+            self.gates = gates
+        self.peek_available = peek_available
+        # Track gates applied by this player (for visibility)
+        self.applied_gates_history = applied_gates_history if applied_gates_history is not None else []
+        # Bullets this player has targeted with a gate this round
+        self.touched_bullets = np.zeros(0, dtype=bool)
+    
+    def __repr__(self) -> str:
+        return (f"Player(name={self.name!r}, player_id={self.player_id!r}, lives={self.lives!r}, "
+                f"gates={self.gates!r}, peek_available={self.peek_available!r}, "
+                f"applied_gates_history={self.applied_gates_history!r})")
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.player_id, self.lives, self.gates, self.peek_available,
+                self.applied_gates_history) == (
+                other.name, other.player_id, other.lives, other.gates, other.peek_available,
+                other.applied_gates_history)
     
     def is_alive(self) -> bool:
         return self.lives > 0
@@ -68,42 +177,70 @@ class Player:
         self.lives = max(0, self.lives - 1)
         return self.is_alive()
     
+    @property
+    def gates(self) -> List[Gate]:
+        """Snapshot of the gates as Gate objects
+        
+        Changing the returned Gates does not change the player; use use_gate,
+        set_gates, or assign a new list to gates.
+        """
+        return [Gate(gt, bool(used)) for gt, used in zip(self._gate_types, self._used)]
+    
+    @gates.setter
+    def gates(self, gates: List[Gate]):
+        self._gate_types = np.empty(len(gates), dtype=object)
+        self._gate_types[:] = [g.gate_type for g in gates]
+        self._used = np.array([g.used for g in gates], dtype=bool)
+    
     def get_available_gates(self) -> List[Gate]:
-        return [g for g in self.gates if not g.used]
+        return [Gate(gt) for gt in self._gate_types[~self._used]]
     
     def has_gate(self, gate_type: GateType) -> bool:
-        return any(g.gate_type == gate_type and not g.used for g in self.gates)
+        return bool(((self._gate_types == gate_type) & ~self._used).any())
     
     def use_gate(self, gate_type: GateType) -> bool:
-        for gate in self.gates:
-            if gate.gate_type == gate_type and not gate.used:
-                gate.used = True
-                return True
+        idx = np.flatnonzero((self._gate_types == gate_type) & ~self._used)
+        if len(idx):
+            self._used[idx[0]] = True
+            return True
         return False
     
-    def reset_for_new_round(self):
-        self.gates = []
+    def reset_for_new_round(self, num_bullets: int):
+        self.set_gates([])
         self.peek_available = True
         self.applied_gates_history = []
+        self.touched_bullets = np.zeros(num_bullets, dtype=bool)
     
     def set_gates(self, gate_types: List[GateType]):
-        self.gates = [Gate(gt) for gt in gate_types]
+        self._gate_types = np.empty(len(gate_types), dtype=object)
+        self._gate_types[:] = list(gate_types)
+        self._used = np.zeros(len(gate_types), dtype=bool)
     
     def record_gate_application(self, gate_type: GateType, target1: int, target2: int = -1):
         self.applied_gates_history.append((gate_type, target1, target2))
+        self.touched_bullets[target1] = True
+        if target2 >= 0:
+            self.touched_bullets[target2] = True
 
 
 class QuantumBulletSystem:
     """
-    Manages the quantum state of bullets using Qiskit.
+    Manages the quantum state of bullets.
+    
+    The bullets' joint state is kept as a statevector and updated in place as
+    gates are applied and bullets are fired. Amplitude index i has bit q set
+    when bullet q is live (qubit 0 is the least significant bit).
     """
     
     def __init__(self, num_bullets: int):
         self.num_bullets = num_bullets
-        self.qr = QuantumRegister(num_bullets, 'bullet')
-        self.cr = ClassicalRegister(num_bullets, 'measure')
-        self.circuit = QuantumCircuit(self.qr, self.cr)
-        self.simulator = AerSimulator()
+        self.state = np.zeros(2 ** num_bullets, dtype=np.complex64)
+        self.state[0] = 1
+        
+        # Column q marks the amplitudes in which bullet q is live
+        index = np.arange(2 ** num_bullets, dtype=np.uint16)
+        self._live_masks = ((index[:, None] >> np.arange(num_bullets, dtype=np.uint16)) & 1).astype(bool)
+        self._live_table = self._live_masks.astype(np.float32)
         
         # Track entanglements: maps qubit -> its entangled partner
         self.entanglements: Dict[int, int] = {}
@@ -115,21 +252,43 @@ class QuantumBulletSystem:
         # Store initial configuration for display
         self.initial_live_positions: List[int] = []
         
+        # Outcomes forced on unfired partners of fired entangled bullets
+        self._collapsed_states: Dict[int, int] = {}
+        
         # Current bullet index (queue position)
         self.current_bullet_index: int = 0
+        
+        # Cached get_probabilities() result, recomputed only after the state changes
+        self._probs_cache: List[Tuple[float, float]] = []
+        self._probs_dirty = True
+        self._categories_cache: Optional[List[str]] = None
+        
+        # Outcome of every bullet drawn from one joint sample of the state;
+        # dropped whenever a gate changes the state
+        self._preshot: Optional[List[int]] = None
+        
+        # Amplitude index while the state is a single basis state (as it is
+        # until a gate creates a superposition), None afterwards
+        self._basis_index: Optional[int] = 0
     
     def initialize_bullets(self, live_positions: List[int]):
-        self.circuit = QuantumCircuit(self.qr, self.cr)
         self.entanglements = {}
         self.measured = [False] * self.num_bullets
         self.measurement_results = [None] * self.num_bullets
         self.initial_live_positions = sorted(live_positions)
         self.current_bullet_index = 0
-        self._collapsed_states = {} 
+        self._collapsed_states = {}
+        self._probs_dirty = True
+        self._preshot = None
         
+        # X on each live position turns |0...0> into a single basis state
+        index = 0
         for pos in live_positions:
             if 0 <= pos < self.num_bullets:
-                self.circuit.x(self.qr[pos])
+                index |= 1 << pos
+        self.state = np.zeros(2 ** self.num_bullets, dtype=np.complex64)
+        self.state[index] = 1
+        self._basis_index = index
     
     def _break_entanglement(self, qubit: int):
         if qubit in self.entanglements:
@@ -153,44 +312,66 @@ class QuantumBulletSystem:
                 return False
         
         try:
-            if gate_type == GateType.X:
-                self.circuit.x(self.qr[target1])
-            elif gate_type == GateType.Y:
-                self.circuit.y(self.qr[target1])
-            elif gate_type == GateType.Z:
-                self.circuit.z(self.qr[target1])
-            elif gate_type == GateType.H:
-                self.circuit.h(self.qr[target1])
-            elif gate_type == GateType.RX:
-                self.circuit.rx(np.pi/2, self.qr[target1])
-            elif gate_type == GateType.RY:
-                self.circuit.ry(np.pi/2, self.qr[target1])
-            elif gate_type == GateType.RZ:
-                self.circuit.rz(np.pi/2, self.qr[target1])
+            matrix = _GATE_MATRICES.get(gate_type)
+            if matrix is not None:
+                self._apply_single(matrix, target1)
             elif gate_type == GateType.CNOT:
                 self._break_entanglement(target2)
-                self.circuit.cx(self.qr[target1], self.qr[target2])
+                self._apply_cnot(target1, target2)
                 self.entanglements[target1] = target2
                 self.entanglements[target2] = target1
             else:
                 return False
+            
+            if self._basis_index is not None:
+                self._basis_index = self._basis_after(gate_type, target1, target2)
+            self._probs_dirty = True
+            self._preshot = None
             return True
         except Exception as e:
             print(f"Error applying gate: {e}")
             return False
     
+    def _basis_after(self, gate_type: GateType, target1: int, target2: int) -> Optional[int]:
+        # X and Y flip the bit (Y up to a phase), Z and Rz only add a phase,
+        # CNOT flips the target when the control bit is set; the rest superpose
+        index = self._basis_index
+        if gate_type in (GateType.X, GateType.Y):
+            return index ^ (1 << target1)
+        if gate_type in (GateType.Z, GateType.RZ):
+            return index
+        if gate_type == GateType.CNOT:
+            return index ^ (((index >> target1) & 1) << target2)
+        return None
+    
+    def _apply_single(self, gate: np.ndarray, qubit: int):
+        _apply_1q(self.state, gate, qubit)
+    
+    def _apply_cnot(self, control: int, target: int):
+        _apply_cx(self.state, control, target)
+    
     def get_current_bullet(self) -> int:
         return self.current_bullet_index
     
+    def pre_sample_all_bullets(self):
+        """Draw every bullet's outcome at once from the current joint state"""
+        if self._basis_index is not None:
+            index = self._basis_index
+        else:
+            probs = (self.state.real ** 2 + self.state.imag ** 2).astype(np.float64)
+            index = _rng.choice(len(probs), p=probs / probs.sum())
+        self._preshot = self._live_masks[index].astype(int).tolist()
+    
     def measure_bullet(self, qubit: int) -> int:
         if self.measured[qubit]:
             return self.measurement_results[qubit]
         
-        if hasattr(self, '_collapsed_states') and qubit in self._collapsed_states:
+        if qubit in self._collapsed_states:
             result_value = self._collapsed_states[qubit]
             self.measured[qubit] = True
             self.measurement_results[qubit] = result_value
             del self._collapsed_states[qubit]
+            self._probs_dirty = True
             
             # Move to next bullet
             self.current_bullet_index += 1
@@ -201,25 +382,22 @@ class QuantumBulletSystem:
         had_entanglement = qubit in self.entanglements
         partner = self.entanglements.get(qubit, -1)
         
-        measure_circuit = self.circuit.copy()
-        measure_circuit.measure(self.qr[qubit], self.cr[qubit])
-        
-        job = self.simulator.run(measure_circuit, shots=1)
-        result = job.result()
-        counts = result.get_counts()
+        # Read the outcome from the joint sample and collapse the state onto
+        # it; the remaining sampled outcomes stay valid for the collapsed state
+        if self._preshot is None:
+            self.pre_sample_all_bullets()
+        result_value = self._preshot[qubit]
         
-        measured_string = list(counts.keys())[0]
-        result_value = int(measured_string[-(qubit+1)])
+        if self._basis_index is None:
+            self.state[self._live_masks[:, qubit] != bool(result_value)] = 0
+            self.state /= np.linalg.norm(self.state)
         
         self.measured[qubit] = True
         self.measurement_results[qubit] = result_value
-        self.circuit.measure(self.qr[qubit], self.cr[qubit])
+        self._probs_dirty = True
         
         # Handle entanglement collapse - partner collapses to correlated state
         if had_entanglement and partner >= 0 and not self.measured[partner]:
-            if not hasattr(self, '_collapsed_states'):
-                self._collapsed_states = {}
-
             self._collapsed_states[partner] = result_value
             
             # Remove entanglement tracking
@@ -239,38 +417,41 @@ class QuantumBulletSystem:
         return bullet_idx, result
     
     def get_probabilities(self) -> List[Tuple[float, float]]:
+        if not self._probs_dirty:
+            return self._probs_cache
+        
+        self._categories_cache = None
         probabilities = []
         try:
-            sv_circuit = self.circuit.copy()
-            sv_circuit.remove_final_measurements()
-            sv_circuit.save_statevector()
-            
-            job = self.simulator.run(sv_circuit)
-            result = job.result()
-            statevector = result.get_statevector()
+            # Every qubit's live probability in one product with the mask table
+            n = self.num_bullets
+            if self._basis_index is not None:
+                # A basis state needs no pass over the amplitudes
+                total = 1.0
+                p_live = self._live_table[self._basis_index]
+            else:
+                amps = self.state
+                p = amps.real * amps.real + amps.imag * amps.imag
+                total = p.sum()
+                p_live = p @ self._live_table
             
-            for qubit in range(self.num_bullets):
+            for qubit in range(n):
                 if self.measured[qubit]:
                     if self.measurement_results[qubit] == 0:
                         probabilities.append((1.0, 0.0))
                     else:
                         probabilities.append((0.0, 1.0))
-                elif hasattr(self, '_collapsed_states') and qubit in self._collapsed_states:
+                elif qubit in self._collapsed_states:
                     if self._collapsed_states[qubit] == 0:
                         probabilities.append((1.0, 0.0))
                     else:
                         probabilities.append((0.0, 1.0))
                 else:
-                    p_zero = 0.0
-                    p_one = 0.0
-                    for i, amplitude in enumerate(statevector):
-                        bit_value = (i >> qubit) & 1
-                        prob = abs(amplitude) ** 2
-                        if bit_value == 0:
-                            p_zero += prob
-                        else:
-                            p_one += prob
-                    probabilities.append((p_zero, p_one))
+                    p_one = float(p_live[qubit])
+                    probabilities.append((float(total) - p_one, p_one))
+            
+            self._probs_cache = probabilities
+            self._probs_dirty = False
         except Exception as e:
             print(f"Error getting probabilities: {e}")
             for qubit in range(self.num_bullets):
@@ -279,7 +460,7 @@ class QuantumBulletSystem:
                         probabilities.append((1.0, 0.0))
                     else:
                         probabilities.append((0.0, 1.0))
-                elif hasattr(self, '_collapsed_states') and qubit in self._collapsed_states:
+                elif qubit in self._collapsed_states:
                     if self._collapsed_states[qubit] == 0:
                         probabilities.append((1.0, 0.0))
                     else:
@@ -289,28 +470,42 @@ class QuantumBulletSystem:
         return probabilities
     
     def get_bullet_state_category(self, qubit: int) -> str:
-        if self.measured[qubit]:
-            if self.measurement_results[qubit] == 1:
-                return 'fired_live'
-            else:
-                return 'fired_blank'
-        
-        if hasattr(self, '_collapsed_states') and qubit in self._collapsed_states:
-            if self._collapsed_states[qubit] == 1:
-                return 'live'
-            else:
-                return 'blank'
-        
-        probs = self.get_probabilities()
-        p_blank, p_live = probs[qubit]
-        is_entangled = qubit in self.entanglements
-        
-        if p_live > 0.99:
-            return 'entangled' if is_entangled else 'live'
-        elif p_live < 0.01:
-            return 'entangled' if is_entangled else 'blank'
-        else:
-            return 'entangled' if is_entangled else 'superposition'
+        return self.get_bullet_state_categories()[qubit]
+    
+    def get_bullet_state_categories(self) -> List[str]:
+        return self.snapshot()[1]
+    
+    def snapshot(self) -> Tuple[List[Tuple[float, float]], List[str]]:
+        """Probabilities and state categories, both derived from one probability fetch"""
+        probabilities = self.get_probabilities()
+        if self._categories_cache is None:
+            self._categories_cache = self._categorize(probabilities)
+        return probabilities, self._categories_cache
+    
+    def _categorize(self, probabilities: List[Tuple[float, float]]) -> List[str]:
+        # Classify every bullet in one vectorized pass
+        n = self.num_bullets
+        p_live = np.array([p[1] for p in probabilities])
+        measured = np.array(self.measured, dtype=bool)
+        fired_live = np.array([r == 1 for r in self.measurement_results], dtype=bool)
+        
+        collapsed = self._collapsed_states
+        is_collapsed = np.zeros(n, dtype=bool)
+        is_collapsed[list(collapsed)] = True
+        collapsed_live = np.zeros(n, dtype=bool)
+        collapsed_live[[q for q, v in collapsed.items() if v == 1]] = True
+        
+        is_entangled = np.zeros(n, dtype=bool)
+        is_entangled[list(self.entanglements)] = True
+        
+        # The first matching condition wins, mirroring the per-bullet rules
+        categories = np.select(
+            [measured & fired_live, measured,
+             is_collapsed & collapsed_live, is_collapsed,
+             is_entangled, p_live > 0.99, p_live < 0.01],
+            ['fired_live', 'fired_blank', 'live', 'blank', 'entangled', 'live', 'blank'],
+            default='superposition')
+        return categories.tolist()
     
     def get_unmeasured_bullets(self) -> List[int]:
         return [i for i in range(self.num_bullets) if not self.measured[i]]
@@ -328,6 +523,10 @@ class QuantumBuckshotGame:
         
         self.player1 = Player("Player 1", 1, num_lives)
         self.player2 = Player("Player 2", 2, num_lives)
+        self._players = (self.player1, self.player2)
+        # Size the per-round state for the chamber, as reset() does
+        for player in self._players:
+            player.reset_for_new_round(num_bullets)
         self.current_player = self.player1
         
         self.bullet_system: Optional[QuantumBulletSystem] = None
@@ -339,18 +538,49 @@ class QuantumBuckshotGame:
         self.gate_selection_player = 1
         self.gate_applied_this_turn = False
         
-        self.all_gate_types = [
+        self.all_gate_types = (
             GateType.X, GateType.Y, GateType.Z, GateType.H,
             GateType.RX, GateType.RY, GateType.RZ, GateType.CNOT
-        ]
+        )
         
         self.on_state_change: Optional[Callable] = None
         self.on_shot_result: Optional[Callable] = None
         self.on_round_end: Optional[Callable] = None
         self.on_game_end: Optional[Callable] = None
     
+    def reset(self, num_bullets: Optional[int] = None, num_gates: Optional[int] = None,
+              num_lives: Optional[int] = None):
+        """Return to the state of a new game, keeping the players and callbacks
+        
+        Settings left as None keep their current values.
+        """
+        if num_bullets is not None:
+            self.num_bullets = num_bullets
+        if num_gates is not None:
+            self.num_gates = num_gates
+        if num_lives is not None:
+            self.initial_lives = num_lives
+        
+        for player in self._players:
+            player.lives = self.initial_lives
+            player.reset_for_new_round(self.num_bullets)
+        self.current_player = self.player1
+        
+        self.bullet_system = None
+        self.round_number = 0
+        self.game_over = False
+        self.winner = None
+        
+        self.phase = "gate_selection"
+        self.gate_selection_player = 1
+        self.gate_applied_this_turn = False
+    
     def get_opponent(self, player: Player) -> Player:
-        return self.player2 if player == self.player1 else self.player1
+        return self.player2 if player is self.player1 else self.player1
+    
+    def get_players_view(self) -> Tuple[Player, Player]:
+        """Both players in order, as the live objects rather than a copy"""
+        return self._players
     
     def start_new_round(self):
         self.round_number += 1
@@ -358,15 +588,13 @@ class QuantumBuckshotGame:
         self.gate_selection_player = 1
         self.gate_applied_this_turn = False
         
-        self.player1.reset_for_new_round()
-        self.player2.reset_for_new_round()
+        self.player1.reset_for_new_round(self.num_bullets)
+        self.player2.reset_for_new_round(self.num_bullets)
         
         min_live = max(1, int(self.num_bullets * 0.3))
         max_live = self.num_bullets - 1
-        num_live = random.randint(min_live, max_live)
-        
-        all_positions = list(range(self.num_bullets))
-        live_positions = random.sample(all_positions, num_live)
+        num_live = int(_rng.integers(min_live, max_live + 1))
+        live_positions = _rng.choice(self.num_bullets, num_live, replace=False).tolist()
         
         self.bullet_system = QuantumBulletSystem(self.num_bullets)
         self.bullet_system.initialize_bullets(live_positions)
@@ -374,8 +602,8 @@ class QuantumBuckshotGame:
         if self.on_state_change:
             self.on_state_change()
     
-    def get_available_gate_types(self) -> List[GateType]:
-        return self.all_gate_types.copy()
+    def get_available_gate_types(self) -> Tuple[GateType, ...]:
+        return self.all_gate_types
     
     def submit_gate_selection(self, player_id: int, selected_gates: List[GateType]) -> bool:
         if len(selected_gates) != self.num_gates:
@@ -388,6 +616,7 @@ class QuantumBuckshotGame:
             self.gate_selection_player = 2
         else:
             self.phase = "show_bullets"
+            self.bullet_system.pre_sample_all_bullets()
         
         if self.on_state_change:
             self.on_state_change()
@@ -517,6 +746,9 @@ class QuantumBuckshotGame:
             return []
         
         player = self.player1 if for_player_id == 1 else self.player2
+        _, categories = self.bullet_system.snapshot()
+        initial_live = set(self.bullet_system.initial_live_positions)
+        touched = player.touched_bullets
         states = []
         
         for i in range(self.num_bullets):
@@ -526,15 +758,10 @@ class QuantumBuckshotGame:
                 else:
                     states.append('fired_blank')
             else:
-                player_modified = any(
-                    t1 == i or t2 == i 
-                    for _, t1, t2 in player.applied_gates_history
-                )
-                
-                if player_modified:
-                    states.append(self.bullet_system.get_bullet_state_category(i))
+                if touched[i]:
+                    states.append(categories[i])
                 else:
-                    if i in self.bullet_system.initial_live_positions:
+                    if i in initial_live:
                         states.append('live')
                     else:
                         states.append('blank')
@@ -543,7 +770,7 @@ class QuantumBuckshotGame:
     def get_game_state(self) -> Dict:
         probabilities = []
         if self.bullet_system:
-            probabilities = self.bullet_system.get_probabilities()
+            probabilities, _ = self.bullet_system.snapshot()
         
         return {
             "phase": self.phase,
@@ -3,7 +3,7 @@ Quantum Buckshot Roulette
 A strategic two-player quantum game
 
 Requirements:
-    pip install qiskit qiskit-aer
+    pip install numpy
 
 To run:
     python main.py
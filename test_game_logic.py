@@ -0,0 +1,334 @@
+"""
+Tests for the statevector gate kernels in game_logic
+"""
+
+import unittest
+import numpy as np
+
+import game_logic
+from game_logic import (_apply_cx_numpy, _apply_cx, Player, Gate, GateType,
+                        QuantumBulletSystem, QuantumBuckshotGame)
+
+# Reference single-qubit matrices, written out independently of game_logic
+_C, _S = np.cos(np.pi / 4), np.sin(np.pi / 4)
+_REFERENCE_GATES = {
+    GateType.X: np.array([[0, 1], [1, 0]]),
+    GateType.Y: np.array([[0, -1j], [1j, 0]]),
+    GateType.Z: np.array([[1, 0], [0, -1]]),
+    GateType.H: np.array([[1, 1], [1, -1]]) / np.sqrt(2),
+    GateType.RX: np.array([[_C, -1j * _S], [-1j * _S, _C]]),
+    GateType.RY: np.array([[_C, -_S], [_S, _C]]),
+    GateType.RZ: np.array([[_C - 1j * _S, 0], [0, _C + 1j * _S]]),
+}
+
+
+def _cx_reference(state: np.ndarray, control: int, target: int) -> np.ndarray:
+    """Apply CX by building its full permutation matrix"""
+    size = state.size
+    matrix = np.zeros((size, size), dtype=state.dtype)
+    for i in range(size):
+        j = i ^ (1 << target) if (i >> control) & 1 else i
+        matrix[j, i] = 1
+    return matrix @ state
+
+
+
+def _reference_state(num_bullets: int, live_positions, gates) -> np.ndarray:
+    """Build the statevector from full Kronecker-product operators"""
+    state = np.zeros(2 ** num_bullets, dtype=complex)
+    state[sum(1 << q for q in live_positions)] = 1
+    for gate_type, target1, target2 in gates:
+        if gate_type == GateType.CNOT:
+            state = _cx_reference(state, target1, target2)
+        else:
+            # Bullet 0 is the least significant bit, so it is the last factor
+            operator = np.ones((1, 1))
+            for q in reversed(range(num_bullets)):
+                operator = np.kron(operator, _REFERENCE_GATES[gate_type] if q == target1 else np.eye(2))
+            state = operator @ state
+    return state
+
+
+def _reference_live_probabilities(state: np.ndarray, num_bullets: int) -> np.ndarray:
+    p = np.abs(state) ** 2
+    index = np.arange(state.size)
+    return np.array([p[(index >> q) & 1 == 1].sum() for q in range(num_bullets)])
+
+
+class SeededRngTestCase(unittest.TestCase):
+    """Replace the module's shared generator with a seeded one for each test"""
+    
+    def setUp(self):
+        self._saved_rng = game_logic._rng
+        game_logic._rng = np.random.default_rng(1234)
+    
+    def tearDown(self):
+        game_logic._rng = self._saved_rng
+
+
+class TestCXKernels(unittest.TestCase):
+    
+    def check_all_pairs(self, kernel, num_bullets: int):
+        rng = np.random.default_rng(0)
+        for control in range(num_bullets):
+            for target in range(num_bullets):
+                if control == target:
+                    continue
+                state = (rng.standard_normal(2 ** num_bullets)
+                         + 1j * rng.standard_normal(2 ** num_bullets)).astype(np.complex64)
+                expected = _cx_reference(state, control, target)
+                kernel(state, control, target)
+                np.testing.assert_allclose(state, expected)
+    
+    def test_numpy_two_bullets(self):
+        self.check_all_pairs(_apply_cx_numpy, 2)
+    
+    def test_numpy_three_bullets(self):
+        self.check_all_pairs(_apply_cx_numpy, 3)
+    
+    def test_selected_kernel(self):
+        for num_bullets in (2, 3):
+            self.check_all_pairs(_apply_cx, num_bullets)
+
+
+class TestQuantumBulletSystem(SeededRngTestCase):
+    
+    def make_system(self, num_bullets, live_positions, gates):
+        system = QuantumBulletSystem(num_bullets)
+        system.initialize_bullets(live_positions)
+        for gate in gates:
+            self.assertTrue(system.apply_gate(*gate))
+        return system
+    
+    def assert_matches_reference(self, system, live_positions, gates):
+        n = system.num_bullets
+        expected = _reference_live_probabilities(_reference_state(n, live_positions, gates), n)
+        p_live = np.array([p[1] for p in system.get_probabilities()])
+        np.testing.assert_allclose(p_live, expected, atol=1e-5)
+        np.testing.assert_allclose([sum(p) for p in system.get_probabilities()], 1, atol=1e-5)
+    
+    def test_single_gates(self):
+        system = self.make_system(3, [1], [(GateType.X, 1, -1)])
+        self.assertEqual(system.get_probabilities()[1], (1.0, 0.0))
+        
+        system = self.make_system(3, [1], [(GateType.H, 0, -1)])
+        self.assertAlmostEqual(system.get_probabilities()[0][1], 0.5, places=5)
+    
+    def test_basis_shortcut_matches_statevector(self):
+        # X, Y, Z, Rz and CNOT keep a basis state, so the shortcut is taken
+        gates = [(GateType.X, 0, -1), (GateType.Y, 2, -1), (GateType.Z, 1, -1),
+                 (GateType.RZ, 3, -1), (GateType.CNOT, 0, 1), (GateType.CNOT, 3, 2)]
+        system = self.make_system(4, [3], gates)
+        self.assertIsNotNone(system._basis_index)
+        self.assert_matches_reference(system, [3], gates)
+        
+        # The shortcut index must name the amplitude the statevector holds
+        probs = np.abs(system.state) ** 2
+        self.assertAlmostEqual(probs[system._basis_index], 1.0, places=5)
+    
+    def test_superposition_matches_statevector(self):
+        gates = [(GateType.H, 0, -1), (GateType.RX, 1, -1), (GateType.CNOT, 0, 2),
+                 (GateType.RY, 3, -1), (GateType.Y, 1, -1), (GateType.CNOT, 3, 1),
+                 (GateType.RZ, 0, -1), (GateType.H, 2, -1)]
+        system = self.make_system(4, [1, 2], [])
+        applied = []
+        for gate in gates:
+            system.apply_gate(*gate)
+            applied.append(gate)
+            self.assert_matches_reference(system, [1, 2], applied)
+        self.assertIsNone(system._basis_index)
+    
+    def test_probability_cache_invalidated(self):
+        system = self.make_system(3, [], [])
+        before = system.get_probabilities()
+        self.assertIs(system.get_probabilities(), before)
+        
+        system.apply_gate(GateType.H, 1)
+        self.assertIsNot(system.get_probabilities(), before)
+        self.assert_matches_reference(system, [], [(GateType.H, 1, -1)])
+        
+        result = system.measure_bullet(1)
+        self.assertEqual(system.get_probabilities()[1], (1.0, 0.0) if result == 0 else (0.0, 1.0))
+    
+    def test_presample_dropped_after_gate(self):
+        system = self.make_system(3, [], [(GateType.H, 0, -1)])
+        system.pre_sample_all_bullets()
+        self.assertIsNotNone(system._preshot)
+        system.apply_gate(GateType.H, 1)
+        self.assertIsNone(system._preshot)
+    
+    def test_presample_is_one_joint_draw(self):
+        # Bullets 0 and 1 form a Bell pair; bullet 2 is independent
+        gates = [(GateType.H, 0, -1), (GateType.CNOT, 0, 1), (GateType.H, 2, -1)]
+        outcomes = set()
+        for _ in range(200):
+            system = self.make_system(3, [], gates)
+            system.pre_sample_all_bullets()
+            preshot = list(system._preshot)
+            fired = [system.fire_next_bullet()[1] for _ in range(3)]
+            self.assertEqual(fired, preshot)
+            self.assertEqual(preshot[0], preshot[1])
+            outcomes.add(tuple(preshot))
+        self.assertEqual(outcomes, {(0, 0, 0), (0, 0, 1), (1, 1, 0), (1, 1, 1)})
+    
+    def test_measure_collapses_state(self):
+        gates = [(GateType.H, 0, -1), (GateType.RY, 1, -1)]
+        for _ in range(20):
+            system = self.make_system(3, [2], gates)
+            result = system.measure_bullet(0)
+            
+            # Amplitudes disagreeing with the result are gone and the rest renormalized
+            index = np.arange(system.state.size)
+            self.assertTrue(np.all(system.state[(index & 1) != result] == 0))
+            self.assertAlmostEqual(np.linalg.norm(system.state), 1.0, places=5)
+            
+            self.assertEqual(system.get_probabilities()[0], (1.0, 0.0) if result == 0 else (0.0, 1.0))
+            self.assertAlmostEqual(system.get_probabilities()[1][1], 0.5, places=5)
+            self.assertAlmostEqual(system.get_probabilities()[2][1], 1.0, places=5)
+    
+    def test_entangled_partner_follows(self):
+        results = set()
+        for _ in range(50):
+            system = self.make_system(3, [], [(GateType.H, 0, -1), (GateType.CNOT, 0, 1)])
+            self.assertEqual(system.get_bullet_state_category(1), 'entangled')
+            
+            result = system.measure_bullet(0)
+            results.add(result)
+            # The partner is now certain and agrees with the control
+            self.assertEqual(system.get_probabilities()[1], (1.0, 0.0) if result == 0 else (0.0, 1.0))
+            self.assertEqual(system.get_bullet_state_category(1), 'live' if result else 'blank')
+            self.assertEqual(system.measure_bullet(1), result)
+        self.assertEqual(results, {0, 1})
+
+
+def _reference_category(system, qubit: int, p_live: float) -> str:
+    """The original per-bullet classification rules"""
+    if system.measured[qubit]:
+        return 'fired_live' if system.measurement_results[qubit] == 1 else 'fired_blank'
+    if qubit in system._collapsed_states:
+        return 'live' if system._collapsed_states[qubit] == 1 else 'blank'
+    if qubit in system.entanglements:
+        return 'entangled'
+    if p_live > 0.99:
+        return 'live'
+    if p_live < 0.01:
+        return 'blank'
+    return 'superposition'
+
+
+class TestCategorize(unittest.TestCase):
+    
+    def test_matches_per_bullet_rules(self):
+        thresholds = [0.0, 0.005, 0.01 - 1e-9, 0.01, 0.01 + 1e-9, 0.5,
+                      0.99 - 1e-9, 0.99, 0.99 + 1e-9, 0.995, 1.0]
+        kinds = ['plain', 'entangled', 'collapsed_live', 'collapsed_blank',
+                 'fired_live', 'fired_blank']
+        cases = [(kind, p) for kind in kinds for p in thresholds]
+        
+        # _categorize only reads the bookkeeping, so skip building a statevector
+        system = QuantumBulletSystem.__new__(QuantumBulletSystem)
+        system.num_bullets = len(cases)
+        system.measured = [kind.startswith('fired') for kind, _ in cases]
+        system.measurement_results = [
+            (1 if kind == 'fired_live' else 0) if kind.startswith('fired') else None
+            for kind, _ in cases]
+        system._collapsed_states = {
+            q: int(kind == 'collapsed_live')
+            for q, (kind, _) in enumerate(cases) if kind.startswith('collapsed')}
+        system.entanglements = {q: q for q, (kind, _) in enumerate(cases) if kind == 'entangled'}
+        
+        probabilities = [(1.0 - p, p) for _, p in cases]
+        categories = system._categorize(probabilities)
+        for q, (kind, p) in enumerate(cases):
+            self.assertEqual(categories[q], _reference_category(system, q, p), (kind, p))
+
+
+class TestPlayerGates(unittest.TestCase):
+    
+    def test_constructor_and_setter(self):
+        player = Player("Player 1", 1, 3, [Gate(GateType.X), Gate(GateType.H, True)])
+        self.assertEqual(player.gates, [Gate(GateType.X), Gate(GateType.H, True)])
+        self.assertFalse(player.has_gate(GateType.H))
+        
+        player.gates = [Gate(GateType.Z)]
+        self.assertTrue(player.use_gate(GateType.Z))
+        self.assertEqual(player.gates, [Gate(GateType.Z, True)])
+    
+    def test_gates_in_repr_and_eq(self):
+        with_x = Player("Player 1", 1, gates=[Gate(GateType.X)])
+        with_h = Player("Player 1", 1, gates=[Gate(GateType.H)])
+        self.assertNotEqual(with_x, with_h)
+        self.assertEqual(with_x, Player("Player 1", 1, gates=[Gate(GateType.X)]))
+        self.assertIn("gates=[Gate(gate_type=<GateType.X: 'X'>, used=False)]", repr(with_x))
+
+
+class TestGameReset(SeededRngTestCase):
+    
+    GATES = [GateType.H, GateType.CNOT, GateType.X]
+    
+    def play_until_game_over(self, game):
+        game.start_new_round()
+        while not game.game_over:
+            if game.phase == 'gate_selection':
+                game.submit_gate_selection(1, self.GATES)
+                game.submit_gate_selection(2, self.GATES)
+                game.start_playing_phase()
+            current = game.bullet_system.current_bullet_index
+            if current + 1 < game.num_bullets:
+                game.apply_gate(GateType.H, current)
+                game.apply_gate(GateType.CNOT, current, current + 1)
+            game.use_peek()
+            result = game.shoot(shoot_self=False)
+            if result['round_over'] and not game.game_over:
+                game.start_new_round()
+    
+    def assert_same_players(self, game, fresh):
+        for player, fresh_player in zip(game.get_players_view(), fresh.get_players_view()):
+            self.assertEqual(player, fresh_player)
+            np.testing.assert_array_equal(player._gate_types, fresh_player._gate_types)
+            np.testing.assert_array_equal(player._used, fresh_player._used)
+            np.testing.assert_array_equal(player.touched_bullets, fresh_player.touched_bullets)
+    
+    def test_reset_matches_new_game(self):
+        game = QuantumBuckshotGame(num_bullets=4, num_gates=3, num_lives=2)
+        notified = []
+        game.on_state_change = lambda: notified.append(True)
+        players = game.get_players_view()
+        self.play_until_game_over(game)
+        
+        game.reset()
+        fresh = QuantumBuckshotGame(num_bullets=4, num_gates=3, num_lives=2)
+        
+        self.assertIs(game.get_players_view(), players)
+        self.assertIs(game.current_player, game.player1)
+        self.assertIsNone(game.bullet_system)
+        self.assertEqual(game.get_game_state(), fresh.get_game_state())
+        self.assert_same_players(game, fresh)
+        
+        # The next round starts exactly like a new game's first round
+        notified.clear()
+        game_logic._rng = np.random.default_rng(99)
+        game.start_new_round()
+        game_logic._rng = np.random.default_rng(99)
+        fresh.start_new_round()
+        self.assertEqual(notified, [True])
+        
+        system, fresh_system = game.bullet_system, fresh.bullet_system
+        np.testing.assert_array_equal(system.state, fresh_system.state)
+        self.assertIsNone(system._preshot)
+        self.assertEqual(system._basis_index, fresh_system._basis_index)
+        self.assertEqual(system.get_probabilities(), fresh_system.get_probabilities())
+        self.assertEqual(game.get_game_state(), fresh.get_game_state())
+        self.assert_same_players(game, fresh)
+    
+    def test_reset_changes_settings(self):
+        game = QuantumBuckshotGame(num_bullets=4, num_gates=3, num_lives=2)
+        self.play_until_game_over(game)
+        game.reset(num_bullets=5, num_gates=2, num_lives=4)
+        fresh = QuantumBuckshotGame(num_bullets=5, num_gates=2, num_lives=4)
+        self.assertEqual(game.get_game_state(), fresh.get_game_state())
+        self.assert_same_players(game, fresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,35 @@ UI Components for Quantum Buckshot Roulette
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import List, Dict, Optional, Callable
+import tkinter.font as tkFont
+from functools import partial
+from typing import List, Dict, Optional, Callable, Tuple
 from game_logic import QuantumBuckshotGame, GateType, Player, Gate
 from animations import AnimationManager
 
+# Gate groupings for the selection screen and name lookup for the dropdown
+_SINGLE_GATES = tuple(gt for gt in GateType if not gt.is_two_qubit())
+_TWO_GATES = tuple(gt for gt in GateType if gt.is_two_qubit())
+_GATE_BY_VALUE = {gt.value: gt for gt in GateType}
+
+# Symbol drawn on a bullet button for each visible bullet state
+_BULLET_SYMBOLS = {
+    'fired_live': "💥",
+    'fired_blank': "💨",
+    'live': "🔴",
+    'blank': "⚪",
+    'superposition': "🟡",
+    'entangled': "🟣",
+}
+
+# Bullet button contents are packed two bytes per bullet so that refreshes can
+# compare them in one go: the state code (plus _CURRENT_FLAG for the bullet up
+# next) and the entangled partner + 1 (0 when no link is shown)
+_STATE_CODE = {'live': 0, 'blank': 1, 'superposition': 2, 'entangled': 3,
+               'fired_live': 4, 'fired_blank': 5}
+_CODE_STATE = tuple(_STATE_CODE)
+_CURRENT_FLAG = 0x08
+
 
 class GameUI:
     """Main game UI controller"""
@@ -45,11 +69,66 @@ class GameUI:
         self.center_window()
         self.animation = AnimationManager(self.root, self.COLORS)
         
+        # Font objects shared by every widget, see _font()
+        self._fonts: Dict[Tuple[int, str, str], tkFont.Font] = {}
+        
+        # Theme lookups resolved once: (color, symbol) for each bullet state
+        # and each player's color by player number
+        self._bullet_visual = {state: (self.COLORS[state], symbol)
+                               for state, symbol in _BULLET_SYMBOLS.items()}
+        self._player_colors = {1: self.COLORS['player1'], 2: self.COLORS['player2']}
+        # Shot result screen for each outcome: (symbol, color, main and sub
+        # text templates filled from the shot result)
+        self._shot_phases = {
+            ('live', 'self'): ("💥", self.COLORS['live'], "{shooter} SHOT THEMSELVES!",
+                               "{target} has {target_lives_remaining} lives remaining"),
+            ('live', 'other'): ("💥", self.COLORS['live'], "{shooter} HIT {target}!",
+                                "{target} has {target_lives_remaining} lives remaining"),
+            ('blank', 'extra'): ("💨", self.COLORS['blank'], "BLANK ROUND!",
+                                 "{shooter} gets another turn!"),
+            ('blank', 'pass'): ("💨", self.COLORS['blank'], "BLANK ROUND!",
+                                "Turn passes to opponent"),
+        }
+        
         self.selected_gates: List[GateType] = []
+        # Names of the selected gates, kept alongside selected_gates for display
+        self._selected_gate_values: List[str] = []
         self.selected_gate_for_apply: Optional[GateType] = None
         self.gate_target1: Optional[int] = None
         self.gate_target2: Optional[int] = None
         
+        # Widgets created by the screen builders
+        self.status_label: Optional[tk.Label] = None
+        self.selected_display: Optional[tk.Label] = None
+        self.selection_label: Optional[tk.Label] = None
+        self.confirm_btn: Optional[tk.Button] = None
+        self.clear_btn: Optional[tk.Button] = None
+        
+        # Widgets of the live playing screen, kept so that state changes within
+        # a turn update them in place instead of rebuilding the screen
+        # Table canvas, created once and packed into each playing screen
+        self.game_canvas: Optional[tk.Canvas] = None
+        self.bullet_buttons: List[tk.Button] = []
+        self._bullet_packed = bytearray()
+        self._player_gate_labels: Dict[int, List[tk.Label]] = {}
+        self._lives_labels: Dict[int, tk.Label] = {}
+        self._peek_label: Optional[tk.Label] = None
+        
+        # State changes mark the screen dirty and are repainted once when Tk
+        # goes idle; _rendered_screen is the (phase, round, selecting player)
+        # of the screen currently up
+        self._dirty = False
+        self._rendered_screen: Optional[Tuple[str, int, int]] = None
+        # Game state the current screen was drawn from, read by click handlers
+        self._last_state: Optional[Dict] = None
+        
+        # Text shown by every countdown label
+        self._countdown_var = tk.StringVar(master=self.root)
+        # Scheduled countdown ticks and what to run when the countdown ends
+        self._countdown_afters: List[str] = []
+        self._countdown_callback: Optional[Callable] = None
+        self.root.bind('<Return>', self.skip_countdown)
+        
         self.game.on_state_change = self.on_game_state_change
         self.game.on_shot_result = self.on_shot_result
         self.game.on_round_end = self.on_round_end
@@ -58,6 +137,23 @@ class GameUI:
         self.main_frame = tk.Frame(self.root, bg=self.COLORS['bg_dark'])
         self.main_frame.pack(fill='both', expand=True)
         self.current_phase_frame: Optional[tk.Frame] = None
+        
+        # One countdown label, packed into whichever screen is counting down
+        self.countdown_label = tk.Label(self.main_frame, textvariable=self._countdown_var,
+            fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
+        
+        # Screen shared by the shot result, round end and game end: three
+        # headline labels over a next-step label or the game end buttons.
+        # Fonts and padding of the headline labels for each of the screens
+        self._phase_layouts = {
+            'shot_result': ((self._font(100), 30), (self._font(32, 'bold'), 10), (self._font(18), 10)),
+            'round_end': ((self._font(32, 'bold'), 50), (self._font(20), 10), (self._font(20), 10)),
+            'game_end': ((self._font(40, 'bold'), 50), (self._font(36, 'bold'), 20), (self._font(24), 20)),
+        }
+        self.create_phase_frame()
+        
+        # Peek results window, built hidden and shown again for each peek
+        self.create_peek_popup()
     
     def center_window(self):
         self.root.update_idletasks()
@@ -66,23 +162,151 @@ class GameUI:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
+    def _font(self, size: int, weight: str = 'normal', slant: str = 'roman') -> tkFont.Font:
+        """Return the shared Arial font of this size and style, creating it once"""
+        key = (size, weight, slant)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkFont.Font(root=self.root, family='Arial', size=size, weight=weight, slant=slant)
+            self._fonts[key] = font
+        return font
+    
     def start(self):
         self.game.start_new_round()
     
+    def create_phase_frame(self):
+        """Build the transition screen; its labels are retargeted on each show"""
+        bg = self.COLORS['bg_dark']
+        
+        self.phase_frame = tk.Frame(self.main_frame, bg=bg)
+        # Label texts are set through their variables
+        self._phase_vars = [tk.StringVar(master=self.root) for _ in range(3)]
+        self._phase_lbls: List[tk.Label] = []
+        for var in self._phase_vars:
+            label = tk.Label(self.phase_frame, textvariable=var, bg=bg)
+            label.pack()
+            self._phase_lbls.append(label)
+        
+        self._phase_next_var = tk.StringVar(master=self.root)
+        self._phase_next_lbl = tk.Label(self.phase_frame, textvariable=self._phase_next_var,
+            font=self._font(14, slant='italic'), fg=self.COLORS['text_dim'], bg=bg)
+        
+        self._game_end_btns = tk.Frame(self.phase_frame, bg=bg)
+        
+        tk.Button(self._game_end_btns, text="🔄 Play Again", font=self._font(14),
+            bg=self.COLORS['accent'], fg='white', width=15, height=2, cursor='hand2',
+            command=self.restart_game).pack(side='left', padx=20)
+        
+        tk.Button(self._game_end_btns, text="🚪 Main Menu", font=self._font(14),
+            bg=self.COLORS['bg_light'], fg='white', width=15, height=2, cursor='hand2',
+            command=self.exit_game).pack(side='left', padx=20)
+    
+    def create_peek_popup(self):
+        bg = self.COLORS['bg_medium']
+        
+        self._peek_popup = tk.Toplevel(self.root, bg=bg, padx=30, pady=20)
+        self._peek_popup.withdraw()
+        self._peek_popup.transient(self.root)
+        self._peek_popup.resizable(False, False)
+        self._peek_popup.protocol("WM_DELETE_WINDOW", self._peek_popup.withdraw)
+        
+        self._peek_result_lbl = tk.Label(self._peek_popup, font=self._font(12),
+            fg=self.COLORS['text_light'], bg=bg, justify='left')
+        self._peek_result_lbl.pack(pady=(0, 15))
+        
+        tk.Button(self._peek_popup, text="OK", font=self._font(11), width=8,
+            bg=self.COLORS['bg_light'], fg=self.COLORS['text_light'], relief='flat',
+            cursor='hand2', command=self._peek_popup.withdraw).pack()
+    
+    def show_peek_popup(self, title: str, text: str):
+        self._peek_popup.title(title)
+        self._peek_result_lbl.configure(text=text)
+        self._peek_popup.deiconify()
+        self._peek_popup.lift()
+    
+    def show_phase_frame(self, name: str, lines: Tuple[Tuple[str, str], ...],
+                         next_text: Optional[str] = None):
+        """Retarget the transition screen to a phase and swap it in
+        
+        lines holds the (text, color) of the three headline labels, followed
+        by next_text if given. Everything is set while the frame is hidden, so
+        it is laid out in one pass.
+        """
+        self.clear_main_frame()
+        
+        for label, var, (font, pady), (text, fg) in zip(
+                self._phase_lbls, self._phase_vars, self._phase_layouts[name], lines):
+            var.set(text)
+            label.configure(font=font, fg=fg)
+            label.pack_configure(pady=pady)
+        
+        self._game_end_btns.pack_forget()
+        if next_text is None:
+            self._phase_next_lbl.pack_forget()
+        else:
+            self._phase_next_var.set(next_text)
+            self._phase_next_lbl.pack(pady=30)
+        
+        self.current_phase_frame = self.phase_frame
+        self.current_phase_frame.pack(fill='both', expand=True)
+    
     def clear_main_frame(self):
+        # The persistent widgets are only hidden; everything else is destroyed
         if self.current_phase_frame:
-            self.current_phase_frame.destroy()
+            self.current_phase_frame.pack_forget()
+            self.current_phase_frame = None
+        # A countdown still running belongs to the screen being replaced
+        self._cancel_countdown()
+        self._countdown_callback = None
+        self.countdown_label.pack_forget()
+        # A peek result belongs to the turn it was taken in
+        self._peek_popup.withdraw()
+        kept = (self.game_canvas, self.countdown_label, self.phase_frame)
         for widget in self.main_frame.winfo_children():
-            widget.destroy()
+            if widget not in kept:
+                widget.destroy()
+        self.bullet_buttons = []
+        self._bullet_packed = bytearray()
+        # The screen is being replaced; a pending repaint would draw over it
+        self._dirty = False
+        self._rendered_screen = None
     
     def on_game_state_change(self):
+        self._schedule_repaint()
+    
+    def _schedule_repaint(self):
+        if not self._dirty:
+            self._dirty = True
+            self.root.after_idle(self._flush_repaint)
+    
+    def _flush_repaint(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        
         state = self.game.get_game_state()
+        self._last_state = state
+        if state['game_over']:
+            # The game end screen is already up
+            return
+        
+        screen = (state['phase'], state['round'], state['gate_selection_player'])
+        if screen == self._rendered_screen:
+            # The screen for this phase is already up. Mid-turn changes are
+            # refreshed in place; the other screens have nothing to update,
+            # and rebuilding them would drop a gate selection in progress or
+            # restart the chamber reveal countdown
+            if state['phase'] == 'playing':
+                self.refresh_playing_ui(state)
+            return
+        
         if state['phase'] == 'gate_selection':
-            self.show_gate_selection_ui()
+            self.show_gate_selection_ui(state)
         elif state['phase'] == 'show_bullets':
-            self.show_bullet_reveal_ui()
+            self.show_bullet_reveal_ui(state)
         elif state['phase'] == 'playing':
-            self.show_playing_ui()
+            self.show_playing_ui(state)
+        self._rendered_screen = screen
     
     def on_shot_result(self, result: Dict):
         pass
@@ -93,92 +317,99 @@ class GameUI:
     def on_game_end(self, winner: Player):
         self.show_game_end_ui(winner)
     
-    def show_gate_selection_ui(self):
+    def show_gate_selection_ui(self, state: Dict):
+        colors = self.COLORS
+        bg = colors['bg_dark']
+        panel_bg = colors['bg_medium']
+        text_light = colors['text_light']
+        
         self.clear_main_frame()
         
-        state = self.game.get_game_state()
         player_num = state['gate_selection_player']
         
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
+        self.current_phase_frame = tk.Frame(self.main_frame, bg=bg)
         self.current_phase_frame.pack(fill='both', expand=True, padx=50, pady=30)
         
-        title_color = self.COLORS['player1'] if player_num == 1 else self.COLORS['player2']
+        title_color = self._player_colors[player_num]
         title = tk.Label(self.current_phase_frame,
             text=f"🎮 PLAYER {player_num} - SELECT YOUR GATES 🎮",
-            font=('Arial', 24, 'bold'), fg=title_color, bg=self.COLORS['bg_dark'])
+            font=self._font(24, 'bold'), fg=title_color, bg=bg)
         title.pack(pady=20)
         
         instructions = tk.Label(self.current_phase_frame,
             text=f"Select {self.game.num_gates} gates. You can select the same gate multiple times.",
-            font=('Arial', 12), fg=self.COLORS['text_dim'], bg=self.COLORS['bg_dark'])
+            font=self._font(12), fg=colors['text_dim'], bg=bg)
         instructions.pack(pady=10)
         
         round_info = tk.Label(self.current_phase_frame, text=f"Round {state['round']}",
-            font=('Arial', 14, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
+            font=self._font(14, 'bold'), fg=colors['accent'], bg=bg)
         round_info.pack(pady=5)
         
-        gates_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_medium'], padx=20, pady=20)
+        gates_frame = tk.Frame(self.current_phase_frame, bg=panel_bg, padx=20, pady=20)
         gates_frame.pack(pady=20, fill='x')
         
         single_label = tk.Label(gates_frame, text="Single-Qubit Gates:",
-            font=('Arial', 12, 'bold'), fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium'])
+            font=self._font(12, 'bold'), fg=text_light, bg=panel_bg)
         single_label.pack(anchor='w', pady=(0, 10))
         
-        single_frame = tk.Frame(gates_frame, bg=self.COLORS['bg_medium'])
+        single_frame = tk.Frame(gates_frame, bg=panel_bg)
         single_frame.pack(fill='x', pady=5)
         
         self.selected_gates = []
+        self._selected_gate_values = []
         
-        single_gates = [gt for gt in GateType if not gt.is_two_qubit()]
-        for gate_type in single_gates:
+        for gate_type in _SINGLE_GATES:
             btn = tk.Button(single_frame, text=gate_type.value,
-                font=('Arial', 12, 'bold'), width=10, height=2,
-                bg=self.COLORS['bg_light'], fg=self.COLORS['text_light'],
-                activebackground=self.COLORS['accent'], relief='flat', cursor='hand2',
-                command=lambda gt=gate_type: self.add_gate_to_selection(gt))
+                font=self._font(12, 'bold'), width=10, height=2,
+                bg=colors['bg_light'], fg=text_light,
+                activebackground=colors['accent'], relief='flat', cursor='hand2',
+                command=partial(self.add_gate_to_selection, gate_type))
             btn.pack(side='left', padx=5, pady=5)
         
         two_label = tk.Label(gates_frame, text="Two-Qubit Gates:",
-            font=('Arial', 12, 'bold'), fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium'])
+            font=self._font(12, 'bold'), fg=text_light, bg=panel_bg)
         two_label.pack(anchor='w', pady=(20, 10))
         
-        two_frame = tk.Frame(gates_frame, bg=self.COLORS['bg_medium'])
+        two_frame = tk.Frame(gates_frame, bg=panel_bg)
         two_frame.pack(fill='x', pady=5)
         
-        two_gates = [gt for gt in GateType if gt.is_two_qubit()]
-        for gate_type in two_gates:
+        for gate_type in _TWO_GATES:
             btn = tk.Button(two_frame, text=gate_type.value,
-                font=('Arial', 12, 'bold'), width=10, height=2,
-                bg=self.COLORS['bg_light'], fg=self.COLORS['text_light'],
-                activebackground=self.COLORS['accent'], relief='flat', cursor='hand2',
-                command=lambda gt=gate_type: self.add_gate_to_selection(gt))
+                font=self._font(12, 'bold'), width=10, height=2,
+                bg=colors['bg_light'], fg=text_light,
+                activebackground=colors['accent'], relief='flat', cursor='hand2',
+                command=partial(self.add_gate_to_selection, gate_type))
             btn.pack(side='left', padx=5, pady=5)
         
-        selected_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_dark'])
+        selected_frame = tk.Frame(self.current_phase_frame, bg=bg)
         selected_frame.pack(pady=15)
         
-        tk.Label(selected_frame, text="Selected Gates:", font=('Arial', 12),
-            fg=self.COLORS['text_light'], bg=self.COLORS['bg_dark']).pack(side='left', padx=5)
+        tk.Label(selected_frame, text="Selected Gates:", font=self._font(12),
+            fg=text_light, bg=bg).pack(side='left', padx=5)
+        
+        self._selected_var = tk.StringVar(master=self.root, value="(none)")
+        self._selection_count_var = tk.StringVar(master=self.root,
+            value=f"Selected: 0 / {self.game.num_gates}")
         
-        self.selected_display = tk.Label(selected_frame, text="(none)",
-            font=('Arial', 12, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
+        self.selected_display = tk.Label(selected_frame, textvariable=self._selected_var,
+            font=self._font(12, 'bold'), fg=colors['accent'], bg=bg)
         self.selected_display.pack(side='left', padx=5)
         
         self.selection_label = tk.Label(self.current_phase_frame,
-            text=f"Selected: 0 / {self.game.num_gates}",
-            font=('Arial', 14), fg=self.COLORS['text_light'], bg=self.COLORS['bg_dark'])
+            textvariable=self._selection_count_var,
+            font=self._font(14), fg=text_light, bg=bg)
         self.selection_label.pack(pady=5)
         
-        btn_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_dark'])
+        btn_frame = tk.Frame(self.current_phase_frame, bg=bg)
         btn_frame.pack(pady=10)
         
         self.clear_btn = tk.Button(btn_frame, text="✗ Clear Selection",
-            font=('Arial', 12), bg=self.COLORS['bg_light'], fg=self.COLORS['text_light'],
+            font=self._font(12), bg=colors['bg_light'], fg=text_light,
             width=15, relief='flat', cursor='hand2', command=self.clear_gate_selection)
         self.clear_btn.pack(side='left', padx=10)
         
         self.confirm_btn = tk.Button(btn_frame, text="✓ CONFIRM",
-            font=('Arial', 14, 'bold'), bg=self.COLORS['accent'], fg=self.COLORS['text_light'],
+            font=self._font(14, 'bold'), bg=colors['accent'], fg=text_light,
             width=15, height=2, relief='flat', cursor='hand2', state='disabled',
             command=self.confirm_gate_selection)
         self.confirm_btn.pack(side='left', padx=10)
@@ -186,20 +417,22 @@ class GameUI:
     def add_gate_to_selection(self, gate_type: GateType):
         if len(self.selected_gates) < self.game.num_gates:
             self.selected_gates.append(gate_type)
+            self._selected_gate_values.append(gate_type.value)
             self.update_selection_display()
     
     def clear_gate_selection(self):
         self.selected_gates = []
+        self._selected_gate_values = []
         self.update_selection_display()
     
     def update_selection_display(self):
         if self.selected_gates:
-            display_text = ", ".join([g.value for g in self.selected_gates])
+            display_text = ", ".join(self._selected_gate_values)
         else:
             display_text = "(none)"
         
-        self.selected_display.configure(text=display_text)
-        self.selection_label.configure(text=f"Selected: {len(self.selected_gates)} / {self.game.num_gates}")
+        self._selected_var.set(display_text)
+        self._selection_count_var.set(f"Selected: {len(self.selected_gates)} / {self.game.num_gates}")
         
         if len(self.selected_gates) == self.game.num_gates:
             self.confirm_btn.configure(state='normal')
@@ -207,104 +440,149 @@ class GameUI:
             self.confirm_btn.configure(state='disabled')
     
     def confirm_gate_selection(self):
-        state = self.game.get_game_state()
-        player_num = state['gate_selection_player']
+        player_num = self._last_state['gate_selection_player']
         self.game.submit_gate_selection(player_num, self.selected_gates.copy())
         
         if player_num == 1:
             self.show_player_switch_screen(2, "select gates")
     
     def show_player_switch_screen(self, next_player: int, action: str):
+        colors = self.COLORS
+        bg = colors['bg_dark']
+        
         self.clear_main_frame()
         
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
+        self.current_phase_frame = tk.Frame(self.main_frame, bg=bg)
         self.current_phase_frame.pack(fill='both', expand=True)
         
-        color = self.COLORS['player1'] if next_player == 1 else self.COLORS['player2']
+        color = self._player_colors[next_player]
         
         msg = tk.Label(self.current_phase_frame, text=f"🔄 SWITCH TO PLAYER {next_player} 🔄",
-            font=('Arial', 32, 'bold'), fg=color, bg=self.COLORS['bg_dark'])
+            font=self._font(32, 'bold'), fg=color, bg=bg)
         msg.pack(expand=True)
         
         action_label = tk.Label(self.current_phase_frame, text=f"Get ready to {action}!",
-            font=('Arial', 18), fg=self.COLORS['text_light'], bg=self.COLORS['bg_dark'])
+            font=self._font(18), fg=colors['text_light'], bg=bg)
         action_label.pack()
         
-        self.countdown_label = tk.Label(self.current_phase_frame, text="5",
-            font=('Arial', 72, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
-        self.countdown_label.pack(pady=30)
+        self._show_countdown(72, pady=30)
         
-        self.do_countdown(5, lambda: self.on_game_state_change())
+        tk.Button(self.current_phase_frame, text="Skip →", font=self._font(12),
+            bg=colors['bg_light'], fg=colors['text_light'],
+            relief='flat', cursor='hand2', command=self.skip_countdown).pack(pady=(0, 30))
+        
+        self.do_countdown(5, self.on_game_state_change)
     
-    def do_countdown(self, seconds: int, callback: Callable):
-        if seconds > 0:
-            self.countdown_label.configure(text=str(seconds))
-            self.root.after(1000, lambda: self.do_countdown(seconds - 1, callback))
-        else:
-            callback()
+    def _show_countdown(self, size: int, **pack_options):
+        """Pack the shared countdown label into the current screen"""
+        self.countdown_label.configure(font=self._font(size, 'bold'))
+        self.countdown_label.pack(in_=self.current_phase_frame, **pack_options)
+        # Keep it above the screen frame it is packed into
+        self.countdown_label.lift()
+    
+    def do_countdown(self, seconds: int, callback: Callable, tick_ms: int = 1000):
+        """Count down on the countdown label every tick_ms, then call callback
+        
+        Every tick is scheduled up front at its offset from the start, so the
+        ticks do not drift and there is one wakeup per tick. The Skip button
+        or Enter ends the countdown early; starting a countdown or leaving its
+        screen cancels any still running.
+        """
+        self._cancel_countdown()
+        self._countdown_callback = callback
+        
+        total_ms = seconds * 1000
+        for elapsed_ms in range(0, total_ms, tick_ms):
+            remaining_ms = total_ms - elapsed_ms
+            text = str(remaining_ms // 1000) if tick_ms >= 1000 else f"{remaining_ms / 1000:.1f}"
+            if elapsed_ms == 0:
+                self._countdown_var.set(text)
+            else:
+                self._countdown_afters.append(
+                    self.root.after(elapsed_ms, self._countdown_var.set, text))
+        self._countdown_afters.append(self.root.after(total_ms, self._finish_countdown))
+    
+    def skip_countdown(self, event=None):
+        if self._countdown_afters:
+            self._cancel_countdown()
+            self._finish_countdown()
+    
+    def _cancel_countdown(self):
+        for after_id in self._countdown_afters:
+            self.root.after_cancel(after_id)
+        self._countdown_afters = []
     
-    def show_bullet_reveal_ui(self):
+    def _finish_countdown(self):
+        callback = self._countdown_callback
+        self._countdown_afters = []
+        self._countdown_callback = None
+        callback()
+    
+    def show_bullet_reveal_ui(self, state: Dict):
+        colors = self.COLORS
+        bg = colors['bg_dark']
+        panel_bg = colors['bg_medium']
+        text_light = colors['text_light']
+        
         self.clear_main_frame()
         
-        state = self.game.get_game_state()
         total, live_positions = self.game.get_initial_bullet_config()
         
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
+        self.current_phase_frame = tk.Frame(self.main_frame, bg=bg)
         self.current_phase_frame.pack(fill='both', expand=True)
         
         title = tk.Label(self.current_phase_frame, text=f"🔫 ROUND {state['round']} - CHAMBER LOADED 🔫",
-            font=('Arial', 28, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
+            font=self._font(28, 'bold'), fg=colors['accent'], bg=bg)
         title.pack(pady=30)
         
         info = tk.Label(self.current_phase_frame,
             text=f"Total: {total} bullets | Live: {len(live_positions)} | Blank: {total - len(live_positions)}",
-            font=('Arial', 16), fg=self.COLORS['text_light'], bg=self.COLORS['bg_dark'])
+            font=self._font(16), fg=text_light, bg=bg)
         info.pack(pady=10)
         
-        bullets_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_dark'])
+        bullets_frame = tk.Frame(self.current_phase_frame, bg=bg)
         bullets_frame.pack(pady=30)
         
         for i in range(total):
             is_live = i in live_positions
-            color = self.COLORS['live'] if is_live else self.COLORS['blank']
+            color = colors['live'] if is_live else colors['blank']
             symbol = "💥" if is_live else "💨"
             
             bullet_frame = tk.Frame(bullets_frame, bg=color, padx=15, pady=15)
             bullet_frame.pack(side='left', padx=8)
             
-            tk.Label(bullet_frame, text=symbol, font=('Arial', 24), bg=color).pack()
-            tk.Label(bullet_frame, text=f"#{i}", font=('Arial', 14, 'bold'),
+            tk.Label(bullet_frame, text=symbol, font=self._font(24), bg=color).pack()
+            tk.Label(bullet_frame, text=f"#{i}", font=self._font(14, 'bold'),
                 fg='white', bg=color).pack()
         
         message = tk.Label(self.current_phase_frame,
             text="🎯 These bullets are loaded in the chamber. Memorize them!",
-            font=('Arial', 14), fg=self.COLORS['text_light'], bg=self.COLORS['bg_dark'])
+            font=self._font(14), fg=text_light, bg=bg)
         message.pack(pady=20)
         
-        self.countdown_label = tk.Label(self.current_phase_frame, text="3",
-            font=('Arial', 64, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
-        self.countdown_label.pack(pady=10)
+        self._show_countdown(64, pady=10)
         
-        gates_info_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_medium'], padx=30, pady=15)
+        gates_info_frame = tk.Frame(self.current_phase_frame, bg=panel_bg, padx=30, pady=15)
         gates_info_frame.pack(pady=20, fill='x', padx=100)
         
         p1_gates = [g['type'] for g in state['player1']['gates']]
         tk.Label(gates_info_frame, text=f"Player 1 Gates: {', '.join(p1_gates)}",
-            font=('Arial', 12), fg=self.COLORS['player1'], bg=self.COLORS['bg_medium']).pack(anchor='w')
+            font=self._font(12), fg=colors['player1'], bg=panel_bg).pack(anchor='w')
         
         p2_gates = [g['type'] for g in state['player2']['gates']]
         tk.Label(gates_info_frame, text=f"Player 2 Gates: {', '.join(p2_gates)}",
-            font=('Arial', 12), fg=self.COLORS['player2'], bg=self.COLORS['bg_medium']).pack(anchor='w')
+            font=self._font(12), fg=colors['player2'], bg=panel_bg).pack(anchor='w')
         
-        self.do_countdown(3, self.game.start_playing_phase)
+        self.do_countdown(3, self.game.start_playing_phase, tick_ms=500)
     
-    def show_playing_ui(self):
+    def show_playing_ui(self, state: Dict):
+        bg = self.COLORS['bg_dark']
+        
         self.clear_main_frame()
         
-        state = self.game.get_game_state()
         current_player = state['current_player']
         
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
+        self.current_phase_frame = tk.Frame(self.main_frame, bg=bg)
         self.current_phase_frame.pack(fill='both', expand=True)
         
         self.selected_gate_for_apply = None
@@ -313,12 +591,12 @@ class GameUI:
         
         self.create_top_bar(state)
         
-        game_area = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_dark'])
+        game_area = tk.Frame(self.current_phase_frame, bg=bg)
         game_area.pack(fill='both', expand=True, padx=20, pady=10)
         
-        self.create_player_panel(game_area, state['player1'], 1, 'left')
+        self.create_player_panel(game_area, state['player1'], 1, 'left', state)
         self.create_game_table(game_area, state)
-        self.create_player_panel(game_area, state['player2'], 2, 'right')
+        self.create_player_panel(game_area, state['player2'], 2, 'right', state)
         self.create_action_panel(state)
     
     def create_top_bar(self, state: Dict):
@@ -326,53 +604,75 @@ class GameUI:
         top_bar.pack(fill='x', padx=10, pady=10)
         top_bar.pack_propagate(False)
         
-        tk.Label(top_bar, text=f"Round {state['round']}", font=('Arial', 16, 'bold'),
+        tk.Label(top_bar, text=f"Round {state['round']}", font=self._font(16, 'bold'),
             fg=self.COLORS['accent'], bg=self.COLORS['bg_medium']).pack(side='left', padx=20, pady=15)
         
         current = state['current_player']
-        color = self.COLORS['player1'] if current == 1 else self.COLORS['player2']
-        tk.Label(top_bar, text=f"🎮 PLAYER {current}'s TURN 🎮", font=('Arial', 18, 'bold'),
+        color = self._player_colors[current]
+        tk.Label(top_bar, text=f"🎮 PLAYER {current}'s TURN 🎮", font=self._font(18, 'bold'),
             fg=color, bg=self.COLORS['bg_medium']).pack(side='left', expand=True, pady=15)
         
-        remaining = len([m for m in state['bullets']['measured'] if not m])
-        tk.Label(top_bar, text=f"Bullets: {remaining}/{state['bullets']['total']}",
-            font=('Arial', 14), fg=self.COLORS['text_light'],
-            bg=self.COLORS['bg_medium']).pack(side='right', padx=20, pady=15)
+        measured = state['bullets']['measured']
+        remaining = len(measured) - sum(measured)
+        self._remaining = remaining
+        self._remaining_label = tk.Label(top_bar, text=f"Bullets: {remaining}/{state['bullets']['total']}",
+            font=self._font(14), fg=self.COLORS['text_light'],
+            bg=self.COLORS['bg_medium'])
+        self._remaining_label.pack(side='right', padx=20, pady=15)
+    
+    def refresh_playing_ui(self, state: Dict):
+        """Update the playing screen in place for a change within the same turn"""
+        measured = state['bullets']['measured']
+        remaining = len(measured) - sum(measured)
+        if remaining != self._remaining:
+            self._remaining = remaining
+            self._remaining_label.configure(text=f"Bullets: {remaining}/{state['bullets']['total']}")
+        
+        for player_num in (1, 2):
+            player_data = state[f'player{player_num}']
+            self._lives_labels[player_num].configure(text=str(player_data['lives']))
+            for label, gate in zip(self._player_gate_labels.get(player_num, ()), player_data['gates']):
+                label.configure(**self._gate_row_options(gate))
+        
+        self.refresh_bullet_buttons(state)
+        self.refresh_action_panel(state)
     
-    def create_player_panel(self, parent: tk.Frame, player_data: Dict, player_num: int, side: str):
-        color = self.COLORS['player1'] if player_num == 1 else self.COLORS['player2']
+    def create_player_panel(self, parent: tk.Frame, player_data: Dict, player_num: int, side: str, state: Dict):
+        color = self._player_colors[player_num]
         
         panel = tk.Frame(parent, bg=self.COLORS['bg_medium'], width=250)
         panel.pack(side=side, fill='y', padx=10, pady=10)
         panel.pack_propagate(False)
         
-        tk.Label(panel, text=f"👤 {player_data['name']}", font=('Arial', 16, 'bold'),
+        tk.Label(panel, text=f"👤 {player_data['name']}", font=self._font(16, 'bold'),
             fg=color, bg=self.COLORS['bg_medium']).pack(pady=15)
         
         lives_frame = tk.Frame(panel, bg=self.COLORS['bg_medium'])
         lives_frame.pack(pady=10)
         
-        tk.Label(lives_frame, text="Lives: ", font=('Arial', 14),
+        tk.Label(lives_frame, text="Lives: ", font=self._font(14),
             fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium']).pack(side='left')
         
-        tk.Label(lives_frame, text=str(player_data['lives']), font=('Arial', 24, 'bold'),
-            fg=self.COLORS['live'], bg=self.COLORS['bg_medium']).pack(side='left')
+        lives_label = tk.Label(lives_frame, text=str(player_data['lives']), font=self._font(24, 'bold'),
+            fg=self.COLORS['live'], bg=self.COLORS['bg_medium'])
+        lives_label.pack(side='left')
+        self._lives_labels[player_num] = lives_label
         
         # Get current player to determine what to show
-        state = self.game.get_game_state()
         current_player_id = state['current_player']
         is_current_player = (player_num == current_player_id)
         
-        tk.Label(panel, text="Gates:", font=('Arial', 12, 'bold'),
+        tk.Label(panel, text="Gates:", font=self._font(12, 'bold'),
             fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium']).pack(pady=(20, 5), anchor='w', padx=15)
         
+        gate_labels = []
         if is_current_player:
             # Show full gate status for current player
             for gate in player_data['gates']:
-                status = "✗" if gate['used'] else "✓"
-                gate_color = self.COLORS['text_dim'] if gate['used'] else self.COLORS['text_light']
-                tk.Label(panel, text=f"  {status} {gate['type']}", font=('Arial', 11),
-                    fg=gate_color, bg=self.COLORS['bg_medium']).pack(anchor='w', padx=15)
+                label = tk.Label(panel, font=self._font(11), bg=self.COLORS['bg_medium'],
+                    **self._gate_row_options(gate))
+                label.pack(anchor='w', padx=15)
+                gate_labels.append(label)
         else:
             # For opponent, only show gate types without used/unused status
             # Count gates by type
@@ -381,110 +681,123 @@ class GameUI:
                 gt = gate['type']
                 gate_counts[gt] = gate_counts.get(gt, 0) + 1
             
-            for gate_type, count in gate_counts.items():
-                if count > 1:
-                    tk.Label(panel, text=f"  • {gate_type} ×{count}", font=('Arial', 11),
-                        fg=self.COLORS['text_dim'], bg=self.COLORS['bg_medium']).pack(anchor='w', padx=15)
-                else:
-                    tk.Label(panel, text=f"  • {gate_type}", font=('Arial', 11),
-                        fg=self.COLORS['text_dim'], bg=self.COLORS['bg_medium']).pack(anchor='w', padx=15)
+            # One multi-line label for the whole list
+            if gate_counts:
+                text = "\n".join(f"  • {gate_type} ×{count}" if count > 1 else f"  • {gate_type}"
+                                 for gate_type, count in gate_counts.items())
+                tk.Label(panel, text=text, justify='left', font=self._font(11),
+                    fg=self.COLORS['text_dim'], bg=self.COLORS['bg_medium']).pack(anchor='w', padx=15)
+        self._player_gate_labels[player_num] = gate_labels
         
         # Peek status - only show for current player
         if is_current_player:
-            peek_status = "Available" if player_data['peek_available'] else "Used"
-            peek_color = self.COLORS['blank'] if player_data['peek_available'] else self.COLORS['text_dim']
-            tk.Label(panel, text=f"👁 Peek: {peek_status}", font=('Arial', 11),
-                fg=peek_color, bg=self.COLORS['bg_medium']).pack(pady=15, anchor='w', padx=15)
+            self._peek_label = tk.Label(panel, font=self._font(11), bg=self.COLORS['bg_medium'],
+                **self._peek_options(player_data['peek_available']))
+            self._peek_label.pack(pady=15, anchor='w', padx=15)
+    
+    def _gate_row_options(self, gate: Dict) -> Dict:
+        status = "✗" if gate['used'] else "✓"
+        gate_color = self.COLORS['text_dim'] if gate['used'] else self.COLORS['text_light']
+        return {'text': f"  {status} {gate['type']}", 'fg': gate_color}
+    
+    def _peek_options(self, peek_available: bool) -> Dict:
+        peek_status = "Available" if peek_available else "Used"
+        peek_color = self.COLORS['blank'] if peek_available else self.COLORS['text_dim']
+        return {'text': f"👁 Peek: {peek_status}", 'fg': peek_color}
     
     def create_game_table(self, parent: tk.Frame, state: Dict):
         center = tk.Frame(parent, bg=self.COLORS['bg_dark'])
         center.pack(side='left', fill='both', expand=True, padx=20)
         
-        self.game_canvas = tk.Canvas(center, width=700, height=350,
-            bg=self.COLORS['bg_dark'], highlightthickness=0)
-        self.game_canvas.pack(pady=5)
-        # Force canvas to update size before drawing
-        self.game_canvas.update()
-        self.animation.draw_table_scene(self.game_canvas, state['current_player'])
-        
-        tk.Label(center, text="🔫 CHAMBER 🔫", font=('Arial', 14, 'bold'),
+        width, height = 700, 350
+        if self.game_canvas is None:
+            # Child of main_frame so it outlives the screens it is shown in
+            self.game_canvas = tk.Canvas(self.main_frame, width=width, height=height,
+                bg=self.COLORS['bg_dark'], highlightthickness=0)
+        self.game_canvas.pack(in_=center, pady=5)
+        # Keep it above the newer screen frames in the stacking order
+        self.game_canvas.lift()
+        # The canvas keeps the size it is created with, so draw at that size
+        # without forcing a layout pass first
+        self.animation.draw_table_scene(self.game_canvas, state['current_player'], (width, height))
+        
+        tk.Label(center, text="🔫 CHAMBER 🔫", font=self._font(14, 'bold'),
             fg=self.COLORS['accent'], bg=self.COLORS['bg_dark']).pack(pady=10)
         
         bullets_frame = tk.Frame(center, bg=self.COLORS['bg_dark'])
         bullets_frame.pack(pady=10)
         
         self.bullet_buttons = []
+        self._bullet_packed = self._pack_bullets(state)
+        
+        for i in range(len(self._bullet_packed) // 2):
+            btn = tk.Button(bullets_frame, font=self._font(10), width=8, height=4,
+                fg='white', highlightthickness=3,
+                command=partial(self.select_bullet_for_gate, i),
+                **self._bullet_options(i, self._bullet_packed))
+            btn.grid(row=0, column=i, padx=5)
+            self.bullet_buttons.append(btn)
+    
+    def refresh_bullet_buttons(self, state: Dict):
+        """Reconfigure only the bullet buttons whose displayed state changed"""
+        packed = self._pack_bullets(state)
+        old = self._bullet_packed
+        if packed == old:
+            return
+        for i in range(len(packed) // 2):
+            if packed[2 * i:2 * i + 2] != old[2 * i:2 * i + 2]:
+                self.bullet_buttons[i].configure(**self._bullet_options(i, packed))
+        self._bullet_packed = packed
+    
+    def _pack_bullets(self, state: Dict) -> bytearray:
+        """What each bullet button shows to the current player, packed"""
         bullets = state['bullets']
         current_bullet = bullets['current_bullet']
         
         visible_states = self.game.get_visible_bullet_states(state['current_player'])
         
+        # Bullets the current player has linked with a two-qubit gate
+        current_player_obj = self.game.player1 if state['current_player'] == 1 else self.game.player2
+        player_entangled = {idx for gt, t1, t2 in current_player_obj.applied_gates_history
+                            if gt.is_two_qubit() for idx in (t1, t2)}
+        
+        packed = bytearray(2 * bullets['total'])
         for i in range(bullets['total']):
-            btn_frame = tk.Frame(bullets_frame, bg=self.COLORS['bg_dark'])
-            btn_frame.pack(side='left', padx=5)
-            
             bullet_state = visible_states[i] if i < len(visible_states) else 'blank'
-            
-            color_map = {
-                'fired_live': self.COLORS['fired_live'],
-                'fired_blank': self.COLORS['fired_blank'],
-                'live': self.COLORS['live'],
-                'blank': self.COLORS['blank'],
-                'superposition': self.COLORS['superposition'],
-                'entangled': self.COLORS['entangled']
-            }
-            color = color_map.get(bullet_state, self.COLORS['blank'])
-            
-            if bullet_state == 'fired_live':
-                symbol = "💥"
-            elif bullet_state == 'fired_blank':
-                symbol = "💨"
-            elif bullet_state == 'live':
-                symbol = "🔴"
-            elif bullet_state == 'blank':
-                symbol = "⚪"
-            elif bullet_state == 'superposition':
-                symbol = "🟡"
-            elif bullet_state == 'entangled':
-                symbol = "🟣"
-            else:
-                symbol = "⚪"
-            
             is_fired = bullets['measured'][i]
-            is_current = (i == current_bullet) and not is_fired
+            code = _STATE_CODE.get(bullet_state, _STATE_CODE['blank'])
+            if i == current_bullet and not is_fired:
+                code |= _CURRENT_FLAG
+            packed[2 * i] = code
             
             # Only show entanglement link if current player created it
-            entangle_text = ""
-            if i in bullets['entanglements'] and not is_fired:
-                # Check if current player applied a two-qubit gate involving this bullet
-                current_player_obj = self.game.player1 if state['current_player'] == 1 else self.game.player2
-                player_created_entanglement = any(
-                    gt.is_two_qubit() and (t1 == i or t2 == i)
-                    for gt, t1, t2 in current_player_obj.applied_gates_history
-                )
-                if player_created_entanglement:
-                    partner = bullets['entanglements'][i]
-                    entangle_text = f"\n🔗{partner}"
-            
-            current_indicator = "➤ " if is_current else ""
-            
-            border_color = self.COLORS['current_bullet'] if is_current else self.COLORS['bg_dark']
-            
-            btn = tk.Button(btn_frame,
-                text=f"{current_indicator}{symbol}\n#{i}{entangle_text}",
-                font=('Arial', 10), width=8, height=4,
-                bg=color, fg='white', activebackground=color,
-                relief='raised' if not is_fired else 'sunken',
-                state='normal' if not is_fired else 'disabled',
-                cursor='hand2' if not is_fired else 'arrow',
-                highlightbackground=border_color, highlightthickness=3,
-                command=lambda idx=i: self.select_bullet_for_gate(idx))
-            btn.pack()
-            self.bullet_buttons.append(btn)
+            if i in bullets['entanglements'] and not is_fired and i in player_entangled:
+                packed[2 * i + 1] = bullets['entanglements'][i] + 1
+        return packed
+    
+    def _bullet_options(self, index: int, packed: bytearray) -> Dict:
+        """Button options for one bullet, read from the packed contents"""
+        code, link = packed[2 * index], packed[2 * index + 1]
+        bullet_state = _CODE_STATE[code & ~_CURRENT_FLAG]
+        color, symbol = self._bullet_visual[bullet_state]
+        
+        is_fired = bullet_state in ('fired_live', 'fired_blank')
+        is_current = bool(code & _CURRENT_FLAG)
+        entangle_text = f"\n🔗{link - 1}" if link else ""
+        current_indicator = "➤ " if is_current else ""
+        border_color = self.COLORS['current_bullet'] if is_current else self.COLORS['bg_dark']
+        
+        return {
+            'text': f"{current_indicator}{symbol}\n#{index}{entangle_text}",
+            'bg': color, 'activebackground': color,
+            'relief': 'raised' if not is_fired else 'sunken',
+            'state': 'normal' if not is_fired else 'disabled',
+            'cursor': 'hand2' if not is_fired else 'arrow',
+            'highlightbackground': border_color,
+        }
     
     def select_bullet_for_gate(self, index: int):
-        state = self.game.get_game_state()
-        if state['bullets']['measured'][index]:
+        if self._last_state['bullets']['measured'][index]:
             return
         
         if self.selected_gate_for_apply:
@@ -492,28 +805,35 @@ class GameUI:
                 if self.gate_target1 is None:
                     self.gate_target1 = index
                     self.update_action_status(f"Control: #{index}. Select target bullet...")
-                    self.bullet_buttons[index].configure(relief='solid')
+                    self.mark_bullet_target(index)
                 else:
                     self.gate_target2 = index
                     self.update_action_status(f"Control: #{self.gate_target1}, Target: #{index}. Click Apply!")
-                    self.bullet_buttons[index].configure(relief='solid')
+                    self.mark_bullet_target(index)
             else:
                 self.gate_target1 = index
                 self.update_action_status(f"Target: #{index}. Click Apply!")
-                self.bullet_buttons[index].configure(relief='solid')
+                self.mark_bullet_target(index)
+    
+    def mark_bullet_target(self, index: int):
+        self.bullet_buttons[index].configure(relief='solid')
+        # Spoil the cached contents so the next refresh restores the button
+        self._bullet_packed[2 * index] = 0xff
     
     def create_action_panel(self, state: Dict):
+        from tkinter import ttk
+        
         action_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_medium'], height=180)
         action_frame.pack(fill='x', padx=10, pady=10)
         action_frame.pack_propagate(False)
         
         current_player = state['current_player']
         player_data = state['player1'] if current_player == 1 else state['player2']
-        color = self.COLORS['player1'] if current_player == 1 else self.COLORS['player2']
+        color = self._player_colors[current_player]
         gate_already_applied = state['gate_applied_this_turn']
         
         tk.Label(action_frame, text=f"🎯 {player_data['name']}'s Actions",
-            font=('Arial', 14, 'bold'), fg=color, bg=self.COLORS['bg_medium']).pack(pady=10)
+            font=self._font(14, 'bold'), fg=color, bg=self.COLORS['bg_medium']).pack(pady=10)
         
         buttons_frame = tk.Frame(action_frame, bg=self.COLORS['bg_medium'])
         buttons_frame.pack(pady=5)
@@ -521,22 +841,18 @@ class GameUI:
         gate_frame = tk.Frame(buttons_frame, bg=self.COLORS['bg_medium'])
         gate_frame.pack(side='left', padx=20)
         
-        gate_label_text = "Apply Gate:" if not gate_already_applied else "Gate Applied ✓"
-        tk.Label(gate_frame, text=gate_label_text, font=('Arial', 11),
-            fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium']).pack()
-        
-        available_gates = [(g['type'], g['used']) for g in player_data['gates']]
-        gate_options = ["None"] + [g[0] for g in available_gates if not g[1]]
+        self._gate_status_label = tk.Label(gate_frame, font=self._font(11),
+            fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium'])
+        self._gate_status_label.pack()
         
         self.gate_var = tk.StringVar(value="None")
-        dropdown_state = 'readonly' if not gate_already_applied else 'disabled'
-        gate_dropdown = ttk.Combobox(gate_frame, textvariable=self.gate_var,
-            values=gate_options, state=dropdown_state, width=12)
-        gate_dropdown.pack(pady=5)
-        gate_dropdown.bind('<<ComboboxSelected>>', self.on_gate_selected)
+        self.gate_dropdown = ttk.Combobox(gate_frame, textvariable=self.gate_var, width=12)
+        self.gate_dropdown.pack(pady=5)
+        self.gate_dropdown.bind('<<ComboboxSelected>>', self.on_gate_selected)
+        self._configure_gate_controls(player_data, gate_already_applied)
         
         btn_state = 'disabled'
-        self.apply_gate_btn = tk.Button(gate_frame, text="⚡ Apply", font=('Arial', 10),
+        self.apply_gate_btn = tk.Button(gate_frame, text="⚡ Apply", font=self._font(10),
             bg=self.COLORS['bg_light'], fg=self.COLORS['text_light'],
             width=10, state=btn_state, command=self.apply_selected_gate)
         self.apply_gate_btn.pack(pady=5)
@@ -545,39 +861,61 @@ class GameUI:
         shoot_frame.pack(side='left', padx=20)
         
         current_bullet = state['bullets']['current_bullet']
-        tk.Label(shoot_frame, text=f"Shoot Bullet #{current_bullet}:",
-            font=('Arial', 11), fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium']).pack()
+        self._shoot_label = tk.Label(shoot_frame, text=f"Shoot Bullet #{current_bullet}:",
+            font=self._font(11), fg=self.COLORS['text_light'], bg=self.COLORS['bg_medium'])
+        self._shoot_label.pack()
         
         shoot_btns = tk.Frame(shoot_frame, bg=self.COLORS['bg_medium'])
         shoot_btns.pack(pady=5)
         
         self.shoot_self_btn = tk.Button(shoot_btns, text="🎯 Shoot Self",
-            font=('Arial', 11), bg='#ff9800', fg='white', width=12, cursor='hand2',
-            command=lambda: self.shoot(True))
+            font=self._font(11), bg='#ff9800', fg='white', width=12, cursor='hand2',
+            command=partial(self.shoot, True))
         self.shoot_self_btn.pack(side='left', padx=5)
         
         self.shoot_opponent_btn = tk.Button(shoot_btns, text="💀 Shoot Opponent",
-            font=('Arial', 11), bg=self.COLORS['live'], fg='white', width=14, cursor='hand2',
-            command=lambda: self.shoot(False))
+            font=self._font(11), bg=self.COLORS['live'], fg='white', width=14, cursor='hand2',
+            command=partial(self.shoot, False))
         self.shoot_opponent_btn.pack(side='left', padx=5)
         
         peek_frame = tk.Frame(buttons_frame, bg=self.COLORS['bg_medium'])
         peek_frame.pack(side='left', padx=20)
         
-        peek_available = player_data['peek_available']
-        self.peek_btn = tk.Button(peek_frame, text="👁 Peek Gates", font=('Arial', 11),
-            bg=self.COLORS['bg_light'] if peek_available else self.COLORS['fired'],
-            fg=self.COLORS['text_light'], width=15,
-            state='normal' if peek_available else 'disabled',
-            cursor='hand2' if peek_available else 'arrow', command=self.use_peek)
+        self.peek_btn = tk.Button(peek_frame, text="👁 Peek Gates", font=self._font(11),
+            fg=self.COLORS['text_light'], width=15, command=self.use_peek,
+            **self._peek_button_options(player_data['peek_available']))
         self.peek_btn.pack(pady=15)
         
         self.status_label = tk.Label(action_frame, text="Select a gate or shoot!",
-            font=('Arial', 11, 'italic'), fg=self.COLORS['text_dim'], bg=self.COLORS['bg_medium'])
+            font=self._font(11, slant='italic'), fg=self.COLORS['text_dim'], bg=self.COLORS['bg_medium'])
         self.status_label.pack(pady=5)
     
+    def refresh_action_panel(self, state: Dict):
+        player_data = state['player1'] if state['current_player'] == 1 else state['player2']
+        self._configure_gate_controls(player_data, state['gate_applied_this_turn'])
+        self._shoot_label.configure(text=f"Shoot Bullet #{state['bullets']['current_bullet']}:")
+        self.peek_btn.configure(**self._peek_button_options(player_data['peek_available']))
+        if self._peek_label is not None:
+            self._peek_label.configure(**self._peek_options(player_data['peek_available']))
+    
+    def _configure_gate_controls(self, player_data: Dict, gate_already_applied: bool):
+        gate_label_text = "Apply Gate:" if not gate_already_applied else "Gate Applied ✓"
+        self._gate_status_label.configure(text=gate_label_text)
+        
+        available_gates = [(g['type'], g['used']) for g in player_data['gates']]
+        gate_options = ["None"] + [g[0] for g in available_gates if not g[1]]
+        dropdown_state = 'readonly' if not gate_already_applied else 'disabled'
+        self.gate_dropdown.configure(values=gate_options, state=dropdown_state)
+    
+    def _peek_button_options(self, peek_available: bool) -> Dict:
+        return {
+            'bg': self.COLORS['bg_light'] if peek_available else self.COLORS['fired'],
+            'state': 'normal' if peek_available else 'disabled',
+            'cursor': 'hand2' if peek_available else 'arrow',
+        }
+    
     def update_action_status(self, text: str):
-        if hasattr(self, 'status_label'):
+        if self.status_label is not None:
             self.status_label.configure(text=text)
     
     def on_gate_selected(self, event):
@@ -589,25 +927,26 @@ class GameUI:
             self.gate_target2 = None
             self.apply_gate_btn.configure(state='disabled')
             self.update_action_status("Select a gate or shoot!")
-        else:
-            for gt in GateType:
-                if gt.value == gate_name:
-                    self.selected_gate_for_apply = gt
-                    self.gate_target1 = None
-                    self.gate_target2 = None
-                    
-                    if gt.is_two_qubit():
-                        self.update_action_status(f"Select control bullet, then target bullet for {gate_name}")
-                    else:
-                        self.update_action_status(f"Select target bullet for {gate_name}")
-                    
-                    self.apply_gate_btn.configure(state='normal')
-                    break
+        elif gate_name in _GATE_BY_VALUE:
+            gt = _GATE_BY_VALUE[gate_name]
+            self.selected_gate_for_apply = gt
+            self.gate_target1 = None
+            self.gate_target2 = None
+            
+            if gt.is_two_qubit():
+                self.update_action_status(f"Select control bullet, then target bullet for {gate_name}")
+            else:
+                self.update_action_status(f"Select target bullet for {gate_name}")
+            
+            self.apply_gate_btn.configure(state='normal')
     
     def apply_selected_gate(self):
         if not self.selected_gate_for_apply:
             return
         
+        # messagebox is only needed for warnings, so import it on first use
+        from tkinter import messagebox
+        
         if self.gate_target1 is None:
             messagebox.showwarning("Warning", "Please select a target bullet first!")
             return
@@ -630,16 +969,16 @@ class GameUI:
             messagebox.showerror("Error", msg)
     
     def shoot(self, shoot_self: bool):
-        state = self.game.get_game_state()
-        current_player = state['current_player']
+        current_player = self._last_state['current_player']
         
         self.animation.animate_shot(self.game_canvas, current_player, shoot_self,
-            callback=lambda: self.execute_shot(shoot_self))
+            callback=partial(self.execute_shot, shoot_self))
     
     def execute_shot(self, shoot_self: bool):
         result = self.game.shoot(shoot_self)
         
         if not result['success']:
+            from tkinter import messagebox
             messagebox.showerror("Error", result.get('message', 'Unknown error'))
             return
         
@@ -650,36 +989,11 @@ class GameUI:
         self.show_shot_result_screen(result)
     
     def show_shot_result_screen(self, result: Dict):
-        self.clear_main_frame()
-        
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
-        self.current_phase_frame.pack(fill='both', expand=True)
-        
         if result['is_live']:
-            symbol = "💥"
-            color = self.COLORS['live']
-            if result['shot_self']:
-                main_text = f"{result['shooter']} SHOT THEMSELVES!"
-            else:
-                main_text = f"{result['shooter']} HIT {result['target']}!"
-            sub_text = f"{result['target']} has {result['target_lives_remaining']} lives remaining"
+            key = ('live', 'self' if result['shot_self'] else 'other')
         else:
-            symbol = "💨"
-            color = self.COLORS['blank']
-            main_text = "BLANK ROUND!"
-            if result['extra_turn']:
-                sub_text = f"{result['shooter']} gets another turn!"
-            else:
-                sub_text = "Turn passes to opponent"
-        
-        tk.Label(self.current_phase_frame, text=symbol,
-            font=('Arial', 100), bg=self.COLORS['bg_dark']).pack(pady=30)
-        
-        tk.Label(self.current_phase_frame, text=main_text,
-            font=('Arial', 32, 'bold'), fg=color, bg=self.COLORS['bg_dark']).pack(pady=10)
-        
-        tk.Label(self.current_phase_frame, text=sub_text,
-            font=('Arial', 18), fg=self.COLORS['text_light'], bg=self.COLORS['bg_dark']).pack(pady=10)
+            key = ('blank', 'extra' if result['extra_turn'] else 'pass')
+        symbol, color, main_tmpl, sub_tmpl = self._shot_phases[key]
         
         if result['round_over']:
             next_text = "Starting new round..."
@@ -690,15 +1004,15 @@ class GameUI:
         else:
             next_player = 1 if result['shooter_id'] == 2 else 2
             next_text = f"Switching to Player {next_player}..."
-            callback = lambda: self.show_player_switch_screen(next_player, "take your turn")
+            callback = partial(self.show_player_switch_screen, next_player, "take your turn")
         
-        tk.Label(self.current_phase_frame, text=next_text,
-            font=('Arial', 14, 'italic'), fg=self.COLORS['text_dim'],
-            bg=self.COLORS['bg_dark']).pack(pady=30)
-        
-        self.countdown_label = tk.Label(self.current_phase_frame, text="3",
-            font=('Arial', 48, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
-        self.countdown_label.pack(pady=10)
+        text_light = self.COLORS['text_light']
+        self.show_phase_frame('shot_result', (
+            (symbol, text_light),
+            (main_tmpl.format_map(result), color),
+            (sub_tmpl.format_map(result), text_light),
+        ), next_text)
+        self._show_countdown(48, pady=10)
         
         self.do_countdown(3, callback)
     
@@ -706,84 +1020,42 @@ class GameUI:
         success, gates = self.game.use_peek()
         
         if not success:
-            messagebox.showinfo("Peek", "Peek has already been used this round!")
+            self.show_peek_popup("Peek", "Peek has already been used this round!")
             return
         
         if gates:
-            gate_list = ", ".join([g.gate_type.value for g in gates])
-            messagebox.showinfo("👁 Peek Result", f"Opponent's available gates:\n\n{gate_list}")
+            gate_list = ", ".join(g.gate_type.value for g in gates)
+            self.show_peek_popup("👁 Peek Result", f"Opponent's available gates:\n\n{gate_list}")
         else:
-            messagebox.showinfo("👁 Peek Result", "Opponent has no gates remaining!")
-        
-        self.on_game_state_change()
+            self.show_peek_popup("👁 Peek Result", "Opponent has no gates remaining!")
     
     def show_round_end_ui(self):
-        self.clear_main_frame()
-        
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
-        self.current_phase_frame.pack(fill='both', expand=True)
-        
-        tk.Label(self.current_phase_frame, text="🔄 ROUND COMPLETE! 🔄",
-            font=('Arial', 32, 'bold'), fg=self.COLORS['accent'],
-            bg=self.COLORS['bg_dark']).pack(pady=50)
-        
-        state = self.game.get_game_state()
-        
-        for pdata, color in [(state['player1'], self.COLORS['player1']), 
-                             (state['player2'], self.COLORS['player2'])]:
-            tk.Label(self.current_phase_frame, text=f"{pdata['name']}: {pdata['lives']} lives",
-                font=('Arial', 20), fg=color, bg=self.COLORS['bg_dark']).pack(pady=10)
-        
-        tk.Label(self.current_phase_frame, text="New round starting...",
-            font=('Arial', 14, 'italic'), fg=self.COLORS['text_dim'],
-            bg=self.COLORS['bg_dark']).pack(pady=30)
-        
-        self.countdown_label = tk.Label(self.current_phase_frame, text="3",
-            font=('Arial', 48, 'bold'), fg=self.COLORS['accent'], bg=self.COLORS['bg_dark'])
-        self.countdown_label.pack()
+        p1, p2 = self.game.get_players_view()
+        self.show_phase_frame('round_end', (
+            ("🔄 ROUND COMPLETE! 🔄", self.COLORS['accent']),
+            (f"{p1.name}: {p1.lives} lives", self._player_colors[p1.player_id]),
+            (f"{p2.name}: {p2.lives} lives", self._player_colors[p2.player_id]),
+        ), "New round starting...")
+        self._show_countdown(48)
         
         self.do_countdown(3, self.game.start_new_round)
     
     def show_game_end_ui(self, winner: Player):
-        self.clear_main_frame()
-        
-        self.current_phase_frame = tk.Frame(self.main_frame, bg=self.COLORS['bg_dark'])
-        self.current_phase_frame.pack(fill='both', expand=True)
-        
-        color = self.COLORS['player1'] if winner.player_id == 1 else self.COLORS['player2']
-        
-        tk.Label(self.current_phase_frame, text="🏆 GAME OVER 🏆",
-            font=('Arial', 40, 'bold'), fg=self.COLORS['accent'],
-            bg=self.COLORS['bg_dark']).pack(pady=50)
-        
-        tk.Label(self.current_phase_frame, text=f"{winner.name} WINS!",
-            font=('Arial', 36, 'bold'), fg=color, bg=self.COLORS['bg_dark']).pack(pady=20)
-        
-        tk.Label(self.current_phase_frame, text="🎉 Congratulations! 🎉",
-            font=('Arial', 24), fg=self.COLORS['text_light'],
-            bg=self.COLORS['bg_dark']).pack(pady=20)
-        
-        btn_frame = tk.Frame(self.current_phase_frame, bg=self.COLORS['bg_dark'])
-        btn_frame.pack(pady=40)
-        
-        tk.Button(btn_frame, text="🔄 Play Again", font=('Arial', 14),
-            bg=self.COLORS['accent'], fg='white', width=15, height=2, cursor='hand2',
-            command=self.restart_game).pack(side='left', padx=20)
-        
-        tk.Button(btn_frame, text="🚪 Main Menu", font=('Arial', 14),
-            bg=self.COLORS['bg_light'], fg='white', width=15, height=2, cursor='hand2',
-            command=self.exit_game).pack(side='left', padx=20)
+        self.show_phase_frame('game_end', (
+            ("🏆 GAME OVER 🏆", self.COLORS['accent']),
+            (f"{winner.name} WINS!", self._player_colors[winner.player_id]),
+            ("🎉 Congratulations! 🎉", self.COLORS['text_light']),
+        ))
+        # Let the headline paint before the buttons are laid out under it
+        self.root.after_idle(self._show_game_end_buttons)
+    
+    def _show_game_end_buttons(self):
+        # Skip if the game end screen was left before Tk went idle
+        if self.game.game_over and self.current_phase_frame is self.phase_frame:
+            self._game_end_btns.pack(pady=40)
     
     def restart_game(self):
-        self.game = QuantumBuckshotGame(
-            num_bullets=self.game.num_bullets,
-            num_gates=self.game.num_gates,
-            num_lives=self.game.initial_lives
-        )
-        self.game.on_state_change = self.on_game_state_change
-        self.game.on_shot_result = self.on_shot_result
-        self.game.on_round_end = self.on_round_end
-        self.game.on_game_end = self.on_game_end
+        self.game.reset()
         self.start()
     
     def exit_game(self):